@@ -1,12 +1,17 @@
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing import shared_memory
+
+from point_loader import count_points, load_points, point_at, split_coordinates
+from predicates import orientation_sign, orientation_sign_xy
+
 
 def main():
-    n = int(input())
-    dots = []
-    
-    for _ in range(n):
-        x, y = map(int, input().split())
-        dots.append((x, y))
-    
+    dots = load_points()
+
     jarvis_algorithm(dots)
 
 
@@ -19,39 +24,302 @@ def calculate_distance_squared(point_a, point_b):
     return (point_a[0] - point_b[0]) ** 2 + (point_a[1] - point_b[1]) ** 2
 
 
+def orientation_at(xs, ys, a, b, c):
+    return orientation_sign_xy(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c])
+
+
+def distance_squared_at(xs, ys, a, b):
+    return (xs[a] - xs[b]) ** 2 + (ys[a] - ys[b]) ** 2
+
+
 def jarvis_algorithm(dots):
-    n = len(dots)
-    
-    if n < 3:
+    hull = jarvis_hull(dots)
+
+    if hull is None:
         print("No")
         return
+
+    print(hull)
+
+
+def jarvis_hull(dots):
+    xs, ys = split_coordinates(dots)
+    n = len(xs)
     
-    if len(dots) == 3 and calculate_orientation(dots[0], dots[1], dots[2]) == 0:
-        print("No")
-        return
-   
-    leftmost_point_index = min(range(n), key=lambda i: (dots[i][0], dots[i][1]))
+    if n < 3:
+        return None
+    
+    if n == 3 and orientation_at(xs, ys, 0, 1, 2) == 0:
+        return None
+
+    return wrap_hull(dots, xs, ys)
+
+
+def wrap_hull(dots, xs, ys, max_points=None):
+    # Заворачивание подарка; при max_points обход прерывается, как только
+    # на оболочке оказывается больше точек, и возвращается None.
+    n = len(xs)
+    leftmost_point_index = min(range(n), key=lambda i: (xs[i], ys[i]))
+    leftmost = (xs[leftmost_point_index], ys[leftmost_point_index])
     hull = []
     current_point = leftmost_point_index
     
     while True:
-        hull.append(dots[current_point])
+        if max_points is not None and len(hull) == max_points:
+            return None
+
+        hull.append(point_at(dots, xs, ys, current_point))
         next_point = (current_point + 1) % n
+
+        # Внутренний цикл — горячее место: для целых координат векторное
+        # произведение считается прямо здесь, для float — адаптивным предикатом.
+        current_x, current_y = xs[current_point], ys[current_point]
+        next_x, next_y = xs[next_point], ys[next_point]
         
         for i in range(n):
-            orientation = calculate_orientation(dots[current_point], dots[i], dots[next_point])
+            x, y = xs[i], ys[i]
+
+            # Дубликаты текущей точки пропускаются: иначе обход может
+            # перескакивать между ними и никогда не вернуться к началу.
+            if x == current_x and y == current_y:
+                continue
+
+            orientation = (x - current_x) * (next_y - current_y) - (y - current_y) * (next_x - current_x)
+            if type(orientation) is not int:
+                orientation = orientation_sign_xy(current_x, current_y, x, y, next_x, next_y)
             
             if orientation > 0 or (orientation == 0 and 
-                                   calculate_distance_squared(dots[current_point], dots[i]) > 
-                                   calculate_distance_squared(dots[current_point], dots[next_point])):
+                                   distance_squared_at(xs, ys, current_point, i) > 
+                                   distance_squared_at(xs, ys, current_point, next_point)):
                 next_point = i
+                next_x, next_y = x, y
         
         current_point = next_point
         
-        if current_point == leftmost_point_index:
+        if (xs[current_point], ys[current_point]) == leftmost:
             break
-    print(hull)
+
+    return hull
+
+
+def monotone_chain_hull(dots):
+    # Тот же результат, что и у jarvis_hull: обход против часовой стрелки от
+    # самой левой (затем нижней) точки, коллинеарные точки на рёбрах выбрасываются.
+    xs, ys = split_coordinates(dots)
+    n = len(xs)
+
+    if n < 3:
+        return None
+
+    if n == 3 and orientation_at(xs, ys, 0, 1, 2) == 0:
+        return None
+
+    # Две устойчивые сортировки дают порядок по (x, y) без кортежа на точку.
+    order = sorted(range(n), key=ys.__getitem__)
+    order.sort(key=xs.__getitem__)
+
+    # Все точки совпадают: Джарвис возвращает одну точку, цепи дали бы две.
+    first, last = order[0], order[-1]
+    if xs[first] == xs[last] and ys[first] == ys[last]:
+        return [point_at(dots, xs, ys, first)]
+
+    lower_chain = []
+    for i in order:
+        while len(lower_chain) >= 2 and orientation_at(xs, ys, lower_chain[-2], lower_chain[-1], i) <= 0:
+            lower_chain.pop()
+        lower_chain.append(i)
+
+    upper_chain = []
+    for i in reversed(order):
+        while len(upper_chain) >= 2 and orientation_at(xs, ys, upper_chain[-2], upper_chain[-1], i) <= 0:
+            upper_chain.pop()
+        upper_chain.append(i)
+
+    return [point_at(dots, xs, ys, i) for i in lower_chain[:-1] + upper_chain[:-1]]
+
+
+AUTO_JARVIS_MIN_POINTS = 64
+
+
+def convex_hull(dots, mode="auto"):
+    if mode == "jarvis":
+        return jarvis_hull(dots)
+
+    if mode == "monotone":
+        return monotone_chain_hull(dots)
+
+    if mode == "parallel":
+        return parallel_convex_hull(dots)
+
+    if mode != "auto":
+        raise ValueError(f"Unknown hull mode: {mode}")
+
+    n = count_points(dots)
+    if n <= AUTO_JARVIS_MIN_POINTS:
+        return monotone_chain_hull(dots)
+
+    # Джарвис стоит O(n·h), монотонная цепь — O(n log n). Джарвису даётся
+    # log2(n) / 2 шагов: если оболочка больше, неудачная попытка стоит
+    # примерно половину монотонной цепи, и дальше считает она.
+    xs, ys = split_coordinates(dots)
+    hull = wrap_hull(dots, xs, ys, n.bit_length() // 2)
+
+    if hull is not None:
+        return hull
+
+    return monotone_chain_hull(dots)
+
+
+PARALLEL_HULL_THRESHOLD = 200_000
+
+
+def pack_coordinates(dots):
+    if isinstance(dots, array) and dots.typecode == 'q':
+        return dots.tobytes()
+
+    if hasattr(dots, "ndim"):
+        return dots.astype('<i8').tobytes()
+
+    return array('q', chain.from_iterable(dots)).tobytes()
+
+
+def shard_hull(memory_name, first_point, last_point):
+    memory = shared_memory.SharedMemory(name=memory_name)
+
+    try:
+        coordinates = array('q')
+        with memory.buf[first_point * 16:last_point * 16] as shard:
+            coordinates.frombytes(shard)
+    finally:
+        memory.close()
+
+    hull = monotone_chain_hull(coordinates)
+
+    if hull is None:
+        return list(zip(coordinates[0::2], coordinates[1::2]))
+
+    return hull
+
+
+def parallel_convex_hull(dots, workers=None, threshold=PARALLEL_HULL_THRESHOLD):
+    n = count_points(dots)
+
+    if n < max(threshold, 4):
+        return convex_hull(dots)
+
+    workers = workers or os.cpu_count() or 1
+    packed = pack_coordinates(dots)
+
+    # Шарды передаются через общую память: в процессы уходит только имя
+    # блока и границы, а обратно — маленькие частичные оболочки.
+    memory = shared_memory.SharedMemory(create=True, size=len(packed))
+    try:
+        memory.buf[:len(packed)] = packed
+        del packed
+
+        shard_size = (n + workers - 1) // workers
+        bounds = [(start, min(start + shard_size, n)) for start in range(0, n, shard_size)]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partial_hulls = list(executor.map(shard_hull,
+                                              [memory.name] * len(bounds),
+                                              [first for first, _ in bounds],
+                                              [last for _, last in bounds]))
+    finally:
+        memory.close()
+        memory.unlink()
+
+    merged = list(dict.fromkeys(chain.from_iterable(partial_hulls)))
+
+    # Правила n < 3 и n == 3 относятся к исходным n > 3 точкам, поэтому
+    # короткий набор дополняется копиями первой точки — оболочку это не меняет.
+    merged += [merged[0]] * (4 - len(merged))
+
+    return monotone_chain_hull(merged)
+
+
+class IncrementalHull:
+    # Нижняя и верхняя цепи хранятся отсортированными по (x, y), поэтому точка
+    # находится бинарным поиском, а удаляются только соседи, переставшие быть
+    # выпуклыми. Снимок совпадает с jarvis_hull на тех же точках. Хранятся
+    # только цепи: для правил n < 3 и n == 3 хватает счётчика, ограниченного 4.
+    def __init__(self, dots=None):
+        self.lower_chain = []
+        self.upper_chain = []
+        self.points_count = 0
+
+        if dots is not None:
+            self.insert_many(dots)
+
+    def insert(self, point):
+        point = (point[0], point[1])
+        self.points_count = min(self.points_count + 1, 4)
+
+        self.insert_into_chain(self.lower_chain, point, 1)
+        self.insert_into_chain(self.upper_chain, point, -1)
+
+    def insert_many(self, points):
+        points = [(point[0], point[1]) for point in points]
+
+        # Большую пачку дешевле слить с текущими цепями за O((h + k) log(h + k)).
+        if len(points) > len(self.lower_chain) + len(self.upper_chain):
+            self.points_count = min(self.points_count + len(points), 4)
+
+            sorted_points = sorted(set(self.lower_chain + self.upper_chain + points))
+            self.lower_chain = build_chain(sorted_points, 1)
+            self.upper_chain = build_chain(sorted_points, -1)
+            return
+
+        for point in points:
+            self.insert(point)
+
+    @staticmethod
+    def insert_into_chain(chain, point, sign):
+        position = bisect_left(chain, point)
+
+        if position < len(chain) and chain[position] == point:
+            return
+
+        if 0 < position < len(chain) and \
+                sign * orientation_sign(chain[position - 1], chain[position], point) >= 0:
+            return
+
+        chain.insert(position, point)
+
+        while position >= 2 and \
+                sign * orientation_sign(chain[position - 2], chain[position - 1], point) <= 0:
+            del chain[position - 1]
+            position -= 1
+
+        while position + 2 < len(chain) and \
+                sign * orientation_sign(point, chain[position + 1], chain[position + 2]) <= 0:
+            del chain[position + 1]
+
+    def snapshot(self):
+        if self.points_count < 3:
+            return None
+
+        hull = self.lower_chain[:-1] + self.upper_chain[:0:-1]
+
+        # Все точки совпали: цепи из одной точки, и срезы выше пусты.
+        if len(self.lower_chain) == 1:
+            hull = list(self.lower_chain)
+
+        if self.points_count == 3 and len(hull) < 3:
+            return None
+
+        return hull
+
+
+def build_chain(sorted_points, sign):
+    chain = []
+    for point in sorted_points:
+        while len(chain) >= 2 and sign * orientation_sign(chain[-2], chain[-1], point) <= 0:
+            chain.pop()
+        chain.append(point)
+
+    return chain
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,105 +1,152 @@
+import heapq
+import json
 import math
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
 from itertools import combinations
+from queue import Queue
+
+from AADS_1 import monotone_chain_hull
+from point_loader import load_points, point_at, split_coordinates
+from predicates import cross_sign, line_intersection, line_y_at, orientation_sign
 
 def dist(a, b):
     return math.sqrt((a[0] - b[0]) ** 2 + (a[1]  - b[1]) ** 2)
 
-def lines_cross(a, b, c, d):
-    if a[0] - b[0] == 0:
-        if c[0] - d[0] == 0 and a[0] == b[0]:
-            return "Colinear"
-        if c[0] - d[0] == 0 and a[0] != b[0]:
-            return None
-        
-        k2 = (c[1] - d[1]) / (c[0] - d[0])
-        b2 = c[1] - k2 * c[0]
-        
-        x = a[0]
-        y = k2 * x + b2
+class Line:
+    # Прямая через точки a и b; k и b (intercept) считаются один раз.
+    __slots__ = ("a", "b", "vertical", "k", "intercept")
 
-        return (x, y)
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+        self.vertical = a[0] - b[0] == 0
 
-    if c[0] - d[0] == 0:
-        if a[0] - b[0] == 0 and c[0] == d[0]:
-            return "Colinear"
-        if a[0] - b[0] == 0 and c[0] != d[0]:
-            return None
-        
-        k1 = (a[1] - b[1]) / (a[0] - b[0])
-        b1 = a[1] - k1 * a[0]
+        if self.vertical:
+            self.k = None
+            self.intercept = None
+        else:
+            self.k = (a[1] - b[1]) / (a[0] - b[0])
+            self.intercept = a[1] - self.k * a[0]
 
-        
-        x = c[0]
-        y = k1 * x + b1
+class Segment(Line):
+    __slots__ = ("min_x", "min_y", "max_x", "max_y")
 
-        return (x, y)
+    def __init__(self, a, b):
+        super().__init__(a, b)
+
+        self.min_x = min(a[0], b[0])
+        self.min_y = min(a[1], b[1])
+        self.max_x = max(a[0], b[0])
+        self.max_y = max(a[1], b[1])
+
+    def box(self):
+        return (self.min_x, self.min_y, self.max_x, self.max_y)
 
-    k1 = (a[1] - b[1]) / (a[0] - b[0])
-    b1 = a[1] - k1 * a[0]
+class Circle:
+    __slots__ = ("o", "r")
 
-    k2 = (c[1] - d[1]) / (c[0] - d[0])
-    b2 = c[1] - k2 * c[0]
+    def __init__(self, o, r):
+        self.o = o
+        self.r = r
 
-    if k1 == k2 and  b1 == b2:
+    def box(self):
+        return circle_box(self.o, self.r)
+
+def lines_cross(a, b, c=None, d=None):
+    # Принимает либо четыре точки, либо две готовые Line/Segment.
+    if c is None:
+        first, second = a, b
+    else:
+        first, second = Line(a, b), Line(c, d)
+
+    if first.vertical and second.vertical:
+        return "Colinear"
+
+    # Вертикальная прямая (и вырожденная, a == b) задаёт только x: точка
+    # пересечения берётся на второй прямой. Векторное произведение здесь
+    # не годится — у вырожденной прямой нулевой направляющий вектор.
+    if first.vertical:
+        return (first.a[0], line_y_at(second.a, second.b, first.a[0]))
+
+    if second.vertical:
+        return (second.a[0], line_y_at(first.a, first.b, second.a[0]))
+
+    # Параллельность, совпадение и сама точка пересечения считаются точно
+    # по векторным произведениям, а не по округлённым k и b.
+    parallel = cross_sign(first.a, first.b, second.a, second.b) == 0
+
+    if parallel and orientation_sign(first.a, first.b, second.a) == 0:
         return "Colinear"
     
-    if k1 == k2 and  b1 != b2:
+    if parallel:
         return None
     
-    x = (b1 - b2) / (k2 - k1)
-    y = k1 * x + b1
+    return line_intersection(first.a, first.b, second.a, second.b)
 
-    return (x, y)
+def segments_cross(a, b, c=None, d=None):
+    if c is None:
+        first, second = a, b
+    else:
+        first, second = Segment(a, b), Segment(c, d)
 
-def segments_cross(a, b, c, d):
-    dot = lines_cross(a, b, c, d)
+    dot = lines_cross(first, second)
 
     if dot is None:
         return None
     
     if dot == "Colinear":
-        if a[0] == b[0] == c[0] == d[0]:
-            y1 = min(a[1], b[1])
-            y2 = max(a[1], b[1])
-            y3 = min(c[1], d[1])
-            y4 = max(c[1], d[1])
+        if first.vertical and second.vertical and first.a[0] == second.a[0]:
+            y1 = first.min_y
+            y2 = first.max_y
+            y3 = second.min_y
+            y4 = second.max_y
 
             if y2 < y3 or y4 < y1:
                 return None
             elif y2 == y3:
-                return (a[0], y2)
+                return (first.a[0], y2)
             elif y4 == y1:
-                return (a[0], y1)
+                return (first.a[0], y1)
             else:
                 return "Colinear"
             
-        a1 = min(a[0], b[0])
-        b1 = max(a[0], b[0])   
+        a1 = first.min_x
+        b1 = first.max_x
 
-        c1 = min(c[0], d[0])
-        d1 = max(c[0], d[0])  
+        c1 = second.min_x
+        d1 = second.max_x
 
         if b1 < c1 or d1 < a1:
             return None
         elif b1 == c1:
-            return max(a, b, key=lambda a: a[0])
+            return max(first.a, first.b, key=lambda a: a[0])
         elif d1 == a1:
-            return max(c, d, key=lambda a: a[0])
+            return max(second.a, second.b, key=lambda a: a[0])
         else:
             return "Colinear"
         
     x, y = dot 
 
-    if min(a[0], b[0]) <= x <= max(a[0], b[0]) and \
-        min(c[0], d[0]) <= x <= max(c[0], d[0]) and \
-        min(a[1], b[1]) <= y <= max(a[1], b[1]) and \
-        min(c[1], d[1]) <= y <= max(c[1], d[1]):
+    if first.min_x <= x <= first.max_x and \
+        second.min_x <= x <= second.max_x and \
+        first.min_y <= y <= first.max_y and \
+        second.min_y <= y <= second.max_y:
         return (x, y)
     
     return None
 
-def segment_and_line_cross(a, b, c, d):
-    dot = lines_cross(a, b, c, d)
+def segment_and_line_cross(a, b, c=None, d=None):
+    if c is None:
+        line, segment = a, b
+    else:
+        line, segment = Line(a, b), Segment(c, d)
+
+    dot = lines_cross(line, segment)
 
     if dot is None:
         return None
@@ -109,14 +156,19 @@ def segment_and_line_cross(a, b, c, d):
 
     x, y = dot 
 
-    if min(c[0], d[0]) <= x <= max(c[0], d[0]) and min(c[1], d[1]) <= y <= max(c[1], d[1]):
+    if segment.min_x <= x <= segment.max_x and segment.min_y <= y <= segment.max_y:
         return (x, y)
     
     return None
 
-def line_and_circle_cross(a, b, o, r):
-    if a[0] - b[0] == 0:
-        x = a[0]
+def line_and_circle_cross(a, b, o=None, r=None):
+    if o is None:
+        line, o, r = a, b.o, b.r
+    else:
+        line = Line(a, b)
+
+    if line.vertical:
+        x = line.a[0]
         a1 = 1
         b1 = -2 * o[1]
         c1 = o[1] ** 2 - r ** 2 + (x - o[0])** 2
@@ -134,8 +186,8 @@ def line_and_circle_cross(a, b, o, r):
 
             return [(x, y1), (x, y2)]
 
-    k = (a[1] - b[1]) / (a[0] - b[0])
-    b = a[1] - k * a[0]
+    k = line.k
+    b = line.intercept
 
     a1 = 1 + k ** 2
     b1 = - 2 * o[0] - 2 * o[1] * k + 2 * k * b
@@ -159,8 +211,13 @@ def line_and_circle_cross(a, b, o, r):
         return [(x1, y1), (x2, y2)]
 
     
-def segment_and_circle_cross(a, b, o, r):
-    dot = line_and_circle_cross(a, b, o, r)
+def segment_and_circle_cross(a, b, o=None, r=None):
+    if o is None:
+        segment, circle = a, b
+    else:
+        segment, circle = Segment(a, b), Circle(o, r)
+
+    dot = line_and_circle_cross(segment, circle)
 
     if dot is None:
         return None
@@ -169,7 +226,7 @@ def segment_and_circle_cross(a, b, o, r):
     for el in dot:
         x, y = el
 
-        if min(a[0], b[0]) <= x <= max(a[0], b[0]) and min(a[1], b[1]) <= y <= max(a[1], b[1]):
+        if segment.min_x <= x <= segment.max_x and segment.min_y <= y <= segment.max_y:
             res.append((x, y))
 
     if res == []: 
@@ -177,7 +234,75 @@ def segment_and_circle_cross(a, b, o, r):
 
     return res
 
-def circles_cross(o1, r1, o2, r2):
+class SegmentArray:
+    # Набор отрезков в виде столбцов array: концы, k, b и габариты считаются
+    # один раз при построении, а проверки против всего набора идут по столбцам.
+    def __init__(self, segments):
+        segments = [(a, b) for a, b in segments]
+        integer = all(type(value) is int for a, b in segments for value in (*a, *b))
+        typecode = 'q' if integer else 'd'
+
+        self.ax, self.ay = array(typecode), array(typecode)
+        self.bx, self.by = array(typecode), array(typecode)
+        self.min_x, self.min_y = array(typecode), array(typecode)
+        self.max_x, self.max_y = array(typecode), array(typecode)
+        self.vertical = array('b')
+        self.k, self.intercept = array('d'), array('d')
+
+        for a, b in segments:
+            segment = Segment(a, b)
+
+            self.ax.append(a[0])
+            self.ay.append(a[1])
+            self.bx.append(b[0])
+            self.by.append(b[1])
+            self.min_x.append(segment.min_x)
+            self.min_y.append(segment.min_y)
+            self.max_x.append(segment.max_x)
+            self.max_y.append(segment.max_y)
+            self.vertical.append(segment.vertical)
+            self.k.append(0.0 if segment.vertical else segment.k)
+            self.intercept.append(0.0 if segment.vertical else segment.intercept)
+
+    def __len__(self):
+        return len(self.ax)
+
+    def __getitem__(self, index):
+        segment = Segment.__new__(Segment)
+
+        segment.a = (self.ax[index], self.ay[index])
+        segment.b = (self.bx[index], self.by[index])
+        segment.vertical = bool(self.vertical[index])
+        segment.k = None if segment.vertical else self.k[index]
+        segment.intercept = None if segment.vertical else self.intercept[index]
+        segment.min_x = self.min_x[index]
+        segment.min_y = self.min_y[index]
+        segment.max_x = self.max_x[index]
+        segment.max_y = self.max_y[index]
+
+        return segment
+
+    def cross_all(self, a, b=None):
+        # Отрезки, чьи габариты не пересекаются с запросом, segments_cross
+        # всё равно отверг бы, поэтому они отсекаются без построения объектов.
+        segment = a if b is None else Segment(a, b)
+        result = []
+
+        for index in range(len(self)):
+            if self.max_x[index] < segment.min_x or segment.max_x < self.min_x[index] or \
+                    self.max_y[index] < segment.min_y or segment.max_y < self.min_y[index]:
+                continue
+
+            cross = segments_cross(segment, self[index])
+            if cross is not None:
+                result.append((index, cross))
+
+        return result
+
+def circles_cross(o1, r1, o2=None, r2=None):
+    if o2 is None:
+        o1, r1, o2, r2 = o1.o, o1.r, r1.o, r1.r
+
     if dist(o1, o2) > r1 + r2:
         return None
     
@@ -202,33 +327,455 @@ def circles_cross(o1, r1, o2, r2):
 
     return line_and_circle_cross(d1, d2, o1, r1)
 
-n = int(input())
-dots = list()
+def sweep_y(segment, point):
+    (x1, y1), (x2, y2) = segment
+
+    if x1 == x2:
+        return point[1]
+
+    return y1 + (y2 - y1) * (point[0] - x1) / (x2 - x1)
+
+def sweep_slope(segment):
+    (x1, y1), (x2, y2) = segment
+
+    if x1 == x2:
+        return (1, 0)
+
+    return (0, (y2 - y1) / (x2 - x1))
+
+def exact_segments_point(first, second):
+    (x1, y1), (x2, y2) = first
+    (x3, y3), (x4, y4) = second
+
+    denominator = (x2 - x1) * (y4 - y3) - (y2 - y1) * (x4 - x3)
+    if denominator == 0:
+        return None
+
+    t = ((x3 - x1) * (y4 - y3) - (y3 - y1) * (x4 - x3)) / denominator
+    u = ((x3 - x1) * (y2 - y1) - (y3 - y1) * (x2 - x1)) / denominator
+
+    if not (0 <= t <= 1 and 0 <= u <= 1):
+        return None
+
+    return (x1 + t * (x2 - x1), y1 + t * (y2 - y1))
+
+def all_segments_cross(segments):
+    # Заметающая прямая Бентли–Оттмана в точной арифметике: события упорядочены
+    # по (x, y), вертикальные отрезки идут последними среди проходящих через
+    # точку. Найденные пары отдаются segments_cross, поэтому ответ для каждой
+    # пары (точка или "Colinear") тот же, что и при переборе всех пар.
+    # Координаты сразу переводятся в Fraction, поэтому float тоже считаются точно.
+    normalized = [tuple(sorted(((Fraction(a[0]), Fraction(a[1])), (Fraction(b[0]), Fraction(b[1])))))
+                  for a, b in segments]
+
+    starting_at = {}
+    for index, (start, _) in enumerate(normalized):
+        starting_at.setdefault(start, []).append(index)
+
+    events = list(set(starting_at) | {end for _, end in normalized})
+    heapq.heapify(events)
+    queued = set(events)
+
+    status = []
+    crossing_pairs = []
+    seen_pairs = set()
+
+    def schedule(first, second, point):
+        crossing = exact_segments_point(normalized[first], normalized[second])
+        if crossing is not None and crossing > point and crossing not in queued:
+            queued.add(crossing)
+            heapq.heappush(events, crossing)
+
+    while events:
+        point = heapq.heappop(events)
+
+        low = bisect_left(status, point[1], key=lambda index: sweep_y(normalized[index], point))
+        high = bisect_right(status, point[1], key=lambda index: sweep_y(normalized[index], point))
+
+        through = status[low:high]
+        starting = starting_at.get(point, [])
+        involved = through + starting
+
+        for first, second in combinations(involved, 2):
+            pair = (min(first, second), max(first, second))
+            if pair not in seen_pairs:
+                seen_pairs.add(pair)
+                crossing_pairs.append(pair)
+
+        continuing = [index for index in involved if normalized[index][1] != point]
+        continuing.sort(key=lambda index: sweep_slope(normalized[index]))
+        status[low:high] = continuing
+
+        if not continuing:
+            if 0 < low < len(status):
+                schedule(status[low - 1], status[low], point)
+            continue
+
+        if low > 0:
+            schedule(status[low - 1], continuing[0], point)
+
+        upper = low + len(continuing)
+        if upper < len(status):
+            schedule(continuing[-1], status[upper], point)
 
-for _ in range(n):
-    x, y = map(int, input().split())
-    dots.append((x,y))
+    result = []
+    for first, second in crossing_pairs:
+        (a, b), (c, d) = segments[first], segments[second]
+        cross = segments_cross(a, b, c, d)
 
+        if cross is not None:
+            result.append((first, second, cross))
+
+    return result
+
+class UniformGrid:
+    # Равномерная сетка по ограничивающим прямоугольникам: в ячейку
+    # попадают номера всех объектов, чей прямоугольник её задевает.
+    def __init__(self, cell_size):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+
+        self.cell_size = cell_size
+        self.cells = {}
+        self.boxes = {}
+
+    def cell_range(self, box):
+        min_x, min_y, max_x, max_y = box
+
+        return (range(math.floor(min_x / self.cell_size), math.floor(max_x / self.cell_size) + 1),
+                range(math.floor(min_y / self.cell_size), math.floor(max_y / self.cell_size) + 1))
+
+    def insert(self, item, box):
+        self.boxes[item] = box
+        columns, rows = self.cell_range(box)
+
+        for column in columns:
+            for row in rows:
+                self.cells.setdefault((column, row), []).append(item)
+
+    def query(self, box):
+        min_x, min_y, max_x, max_y = box
+        columns, rows = self.cell_range(box)
+        candidates = set()
+
+        for column in columns:
+            for row in rows:
+                for item in self.cells.get((column, row), ()):
+                    if item in candidates:
+                        continue
+
+                    item_min_x, item_min_y, item_max_x, item_max_y = self.boxes[item]
+                    if item_min_x <= max_x and min_x <= item_max_x and \
+                            item_min_y <= max_y and min_y <= item_max_y:
+                        candidates.add(item)
+
+        return sorted(candidates)
+
+def circle_box(o, r):
+    return (o[0] - r, o[1] - r, o[0] + r, o[1] + r)
+
+def segment_box(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[0], b[0]), max(a[1], b[1]))
+
+class CircleIndex:
+    def __init__(self, circles, cell_size=None):
+        self.circles = [(o, r) for o, r in circles]
+
+        if cell_size is None:
+            diameters = [2 * r for _, r in self.circles if r > 0]
+            cell_size = sum(diameters) / len(diameters) if diameters else 1
+
+        self.grid = UniformGrid(cell_size)
+        for index, (o, r) in enumerate(self.circles):
+            self.grid.insert(index, circle_box(o, r))
+
+    def segment_cross(self, a, b):
+        result = []
+        for index in self.grid.query(segment_box(a, b)):
+            o, r = self.circles[index]
+            cross = segment_and_circle_cross(a, b, o, r)
+
+            if cross is not None:
+                result.append((index, cross))
+
+        return result
+
+    def circle_cross(self, o, r):
+        result = []
+        for index in self.grid.query(circle_box(o, r)):
+            other_o, other_r = self.circles[index]
+            cross = circles_cross(o, r, other_o, other_r)
+
+            if cross is not None:
+                result.append((index, cross))
+
+        return result
+
+    def all_circles_cross(self):
+        result = []
+        for first, (o, r) in enumerate(self.circles):
+            for second in self.grid.query(circle_box(o, r)):
+                if second <= first:
+                    continue
+
+                other_o, other_r = self.circles[second]
+                cross = circles_cross(o, r, other_o, other_r)
+
+                if cross is not None:
+                    result.append((first, second, cross))
+
+        return result
+
+class SegmentIndex:
+    def __init__(self, segments, cell_size=None):
+        self.segments = [(a, b) for a, b in segments]
+
+        if cell_size is None:
+            sizes = [max(box[2] - box[0], box[3] - box[1])
+                     for box in (segment_box(a, b) for a, b in self.segments)]
+            sizes = [size for size in sizes if size > 0]
+            cell_size = sum(sizes) / len(sizes) if sizes else 1
+
+        self.grid = UniformGrid(cell_size)
+        for index, (a, b) in enumerate(self.segments):
+            self.grid.insert(index, segment_box(a, b))
+
+    def circle_cross(self, o, r):
+        result = []
+        for index in self.grid.query(circle_box(o, r)):
+            a, b = self.segments[index]
+            cross = segment_and_circle_cross(a, b, o, r)
+
+            if cross is not None:
+                result.append((index, cross))
+
+        return result
+
+    def segment_cross(self, a, b):
+        result = []
+        for index in self.grid.query(segment_box(a, b)):
+            c, d = self.segments[index]
+            cross = segments_cross(a, b, c, d)
+
+            if cross is not None:
+                result.append((index, cross))
+
+        return result
+
+def all_circles_cross(circles, cell_size=None):
+    return CircleIndex(circles, cell_size).all_circles_cross()
 
 def geron(a, b, c):
     ab = dist(a, b)
     bc = dist(b, c)
     ac = dist(a, c)
 
+    return geron_by_sides(ab, bc, ac)
+
+def geron_by_sides(ab, bc, ac):
     p = (ab + bc + ac) / 2
 
     return math.sqrt(p * (p - ab) * (p - bc) * (p - ac))
 
+def dist_at(xs, ys, i, j):
+    return math.sqrt((xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2)
+
+def geron_at(xs, ys, i, j, k):
+    return geron_by_sides(dist_at(xs, ys, i, j), dist_at(xs, ys, j, k), dist_at(xs, ys, i, k))
+
 def tringle_in_triangle(dots):
-    triangles = list(combinations(dots, 3))
-    for a, b, c in triangles:
-        for d in dots:
-            if d in[a, b, c]:
+    xs, ys = split_coordinates(dots)
+    n = len(xs)
+
+    for a, b, c in combinations(range(n), 3):
+        for d in range(n):
+            if any(xs[d] == xs[v] and ys[d] == ys[v] for v in (a, b, c)):
                 continue
 
-            if math.isclose(geron(a, b, c), geron(a, b, d) + geron(a, d, c) + geron(d, b, c)):
+            if math.isclose(geron_at(xs, ys, a, b, c), geron_at(xs, ys, a, b, d) + geron_at(xs, ys, a, d, c) + geron_at(xs, ys, d, b, c)):
                 return True
             
     return False
 
-print(tringle_in_triangle(dots))
\ No newline at end of file
+def fan_triangle(hull, point):
+    origin = hull[0]
+    low = 1
+    high = len(hull) - 1
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        if orientation_sign(origin, hull[middle], point) >= 0:
+            low = middle
+        else:
+            high = middle
+
+    return (origin, hull[low], hull[high])
+
+def find_tringle_in_triangle(dots):
+    # Тот же ответ, что у tringle_in_triangle, но через выпуклую оболочку и
+    # целочисленные ориентации. Возвращает (треугольник, точка внутри) или None.
+    xs, ys = split_coordinates(dots)
+    n = len(xs)
+
+    if n < 4:
+        return None
+
+    points = [point_at(dots, xs, ys, i) for i in range(n)]
+    multiplicity = {}
+    for point in points:
+        multiplicity[point] = multiplicity.get(point, 0) + 1
+
+    distinct_points = list(multiplicity)
+    hull = monotone_chain_hull(distinct_points) if len(distinct_points) >= 3 else None
+
+    # Все точки на одной прямой: любые три точки, отличные от d, дают
+    # вырожденный треугольник нулевой площади, который «содержит» d.
+    if hull is None or len(hull) < 3:
+        point = min(distinct_points, key=multiplicity.get)
+        others = [other for other in points if other != point]
+        if len(others) < 3:
+            return None
+        return (tuple(others[:3]), point)
+
+    # Точка, не являющаяся вершиной оболочки, лежит в одном из треугольников веера.
+    if len(distinct_points) > len(hull):
+        vertices = set(hull)
+        point = next(point for point in distinct_points if point not in vertices)
+        return (fan_triangle(hull, point), point)
+
+    # Все точки — вершины оболочки; остаётся трижды повторённая точка,
+    # которая образует вырожденный треугольник с любой другой.
+    for point, count in multiplicity.items():
+        if count >= 3:
+            other = next(other for other in distinct_points if other != point)
+            return ((point, point, point), other)
+
+    return None
+
+def fast_tringle_in_triangle(dots):
+    return find_tringle_in_triangle(dots) is not None
+
+PRIMITIVES = {
+    "lines_cross": lines_cross,
+    "segments_cross": segments_cross,
+    "segment_and_line_cross": segment_and_line_cross,
+    "line_and_circle_cross": line_and_circle_cross,
+    "segment_and_circle_cross": segment_and_circle_cross,
+    "circles_cross": circles_cross,
+    "all_segments_cross": all_segments_cross,
+    "all_circles_cross": all_circles_cross,
+    "tringle_in_triangle": fast_tringle_in_triangle,
+    "find_tringle_in_triangle": find_tringle_in_triangle,
+}
+
+def as_tuples(value):
+    if isinstance(value, list):
+        return tuple(as_tuples(item) for item in value)
+
+    return value
+
+def answer_request(line):
+    # Запрос: {"id": ..., "primitive": "circles_cross", "args": [[0, 0], 1, [1, 0], 1]}.
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as error:
+        return json.dumps({"error": f"Bad JSON: {error}"})
+
+    if not isinstance(request, dict):
+        return json.dumps({"error": "Request must be a JSON object"})
+
+    response = {"id": request.get("id")}
+
+    try:
+        primitive = PRIMITIVES[request["primitive"]]
+        args = [as_tuples(arg) for arg in request.get("args", [])]
+        response["result"] = primitive(*args)
+    except Exception as error:
+        response["error"] = f"{type(error).__name__}: {error}"
+
+    return json.dumps(response, ensure_ascii=False)
+
+def write_answers(pending, output, errors):
+    # Отдельный поток печатает ответы в порядке запросов сразу, как только
+    # готов очередной, не дожидаясь следующей входной строки.
+    while True:
+        future = pending.get()
+        if future is None:
+            return
+
+        if errors:
+            continue
+
+        try:
+            print(future.result(), file=output, flush=True)
+        except Exception as error:
+            errors.append(error)
+
+def serve_requests(source=None, output=None, workers=None, max_pending=1024):
+    # Запросы читаются построчно и раздаются пулу процессов; ответы выводятся
+    # в порядке запросов, а очередь ограничена, поэтому бесконечный pipe
+    # не вычитывается в память целиком.
+    output = output or sys.stdout
+    lines = open(source, encoding="utf-8") if source else sys.stdin
+
+    pending = Queue(maxsize=max_pending)
+    errors = []
+    writer = threading.Thread(target=write_answers, args=(pending, output, errors), daemon=True)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            writer.start()
+
+            try:
+                for line in lines:
+                    if not line.strip():
+                        continue
+
+                    pending.put(executor.submit(answer_request, line))
+            finally:
+                pending.put(None)
+                writer.join()
+    finally:
+        if source:
+            lines.close()
+
+    if errors:
+        raise errors[0]
+
+def run_tests():
+    test_cases = [
+        (lines_cross, ((0, 0), (2, 2), (0, 2), (2, 0)), (1.0, 1.0), "Обычное пересечение"),
+        (lines_cross, ((0, 0), (0, 5), (1, 1), (3, 2)), (0, 0.5), "Вертикальная прямая"),
+        (lines_cross, ((0, 0), (1, 1), (0, 1), (1, 2)), None, "Параллельные прямые"),
+        (lines_cross, ((0, 0), (1, 1), (2, 2), (3, 3)), "Colinear", "Совпадающие прямые"),
+        (lines_cross, ((0, 2), (2, 0), (3, -2), (3, -2)), (3, -1.0), "Вырожденная прямая"),
+        (lines_cross, ((0, 0), (10 ** 9, 10 ** 9 - 1), (0, 1), (10 ** 9 + 1, 10 ** 9 + 1)),
+         (-1.000000001e+18, -1e+18), "Почти параллельные"),
+        (segments_cross, ((-2, 1), (-2, 1), (2, 0), (-2, -2)), None, "Точка вне отрезка"),
+        (segments_cross, ((1, 1), (1, 1), (0, 0), (2, 2)), (1, 1.0), "Точка на отрезке"),
+        (segments_cross, ((0.5, 0.0), (2.5, 2.0), (0.0, 2.0), (2.0, 0.0)), (1.25, 0.75), "Дробные координаты"),
+    ]
+
+    print("Тестирование пересечений:")
+    print("=" * 60)
+
+    for function, args, expected, description in test_cases:
+        result = function(*args)
+        status = "✓" if result == expected else "✗"
+        print(f"{status} {description:20} | {function.__name__}{args} -> {result}")
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        serve_requests(sys.argv[2] if len(sys.argv) > 2 else None)
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--test":
+        run_tests()
+        return
+
+    dots = load_points()
+    print(fast_tringle_in_triangle(dots))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,28 @@
+from array import array
+from bisect import bisect_left
+
+from AADS_4 import build_prefix_function
+from pattern_cache import PATTERN_CACHE
+
+ALPHABET_SIZE = 26
+
+
 def finite_state_machine_search(text, pattern):
     text = text.lower()
     pattern = pattern.lower()
 
-    transition_table = build_transition_table(pattern)
+    compiled = PATTERN_CACHE.get("fsm", pattern, "a-z", CompiledFSMPattern)
     
-    return search_pattern(text, pattern, transition_table)
+    return compiled.search(text)
+
+
+class CompiledFSMPattern:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.transition_table = build_flat_transition_table(pattern)
+
+    def search(self, text):
+        return search_pattern_flat(text, self.pattern, self.transition_table)
 
 
 def build_transition_table(pattern):
@@ -33,6 +51,35 @@ def build_transition_table(pattern):
     return transition_table
 
 
+def build_flat_transition_table(pattern):
+    # Та же таблица, что и у build_transition_table, но за O(m·Σ): переход из
+    # состояния state по несовпавшему символу копируется из состояния
+    # prefix_function[state - 1]. Строки хранятся подряд в одном array('I').
+    pattern_length = len(pattern)
+    transition_table = array('I', [0]) * ((pattern_length + 1) * ALPHABET_SIZE)
+
+    if pattern_length == 0:
+        return transition_table
+
+    prefix_function = build_prefix_function(pattern)
+
+    for state in range(pattern_length):
+        row = state * ALPHABET_SIZE
+
+        if state > 0:
+            fallback_row = prefix_function[state - 1] * ALPHABET_SIZE
+            transition_table[row:row + ALPHABET_SIZE] = transition_table[fallback_row:fallback_row + ALPHABET_SIZE]
+
+        char_index = ord(pattern[state]) - ord('a')
+        if 0 <= char_index < ALPHABET_SIZE:
+            transition_table[row + char_index] = state + 1
+
+    final_row = pattern_length * ALPHABET_SIZE
+    transition_table[final_row:final_row + ALPHABET_SIZE] = array('I', [pattern_length]) * ALPHABET_SIZE
+
+    return transition_table
+
+
 def search_pattern(text, pattern, transition_table):
     current_state = 0
     pattern_length = len(pattern)
@@ -50,6 +97,316 @@ def search_pattern(text, pattern, transition_table):
     return False
 
 
+def search_pattern_flat(text, pattern, transition_table):
+    current_state = 0
+    pattern_length = len(pattern)
+    
+    for character in text:
+        if 'a' <= character <= 'z':
+            char_index = ord(character) - ord('a')
+            current_state = transition_table[current_state * ALPHABET_SIZE + char_index]
+            
+            if current_state == pattern_length:
+                return True
+        else:
+            current_state = 0
+    
+    return False
+
+
+class CompressedAutomaton:
+    # Автомат по произвольному алфавиту. Переход по умолчанию ведёт в 0,
+    # а в строке состояния хранятся только ненулевые переходы (исключения),
+    # отсортированные по коду символа. Таких переходов O(m), поэтому память
+    # зависит от длины шаблона, а не от размера алфавита.
+    # Для байтов кодом служит сам байт, для строк символы шаблона
+    # перенумеровываются в 1..σ, а все прочие символы получают код 0.
+    def __init__(self, pattern, ignore_case=True):
+        self.binary = isinstance(pattern, (bytes, bytearray, memoryview))
+        self.ignore_case = ignore_case and not self.binary
+
+        if self.binary:
+            symbols = bytes(pattern)
+            self.symbol_codes = None
+        else:
+            if self.ignore_case:
+                pattern = pattern.lower()
+            self.symbol_codes = {char: code + 1 for code, char in enumerate(sorted(set(pattern)))}
+            symbols = [self.symbol_codes[char] for char in pattern]
+
+        self.pattern_length = len(symbols)
+        self.row_start = array('I', [0])
+        self.row_symbols = array('I')
+        self.row_targets = array('I')
+
+        if self.pattern_length == 0:
+            return
+
+        prefix_function = build_prefix_function(symbols)
+
+        rows = []
+        for state in range(self.pattern_length + 1):
+            row = dict(rows[prefix_function[state - 1]]) if state > 0 else {}
+
+            if state < self.pattern_length:
+                row[symbols[state]] = state + 1
+
+            rows.append(row)
+
+            for symbol in sorted(row):
+                if row[symbol]:
+                    self.row_symbols.append(symbol)
+                    self.row_targets.append(row[symbol])
+            self.row_start.append(len(self.row_symbols))
+
+    def code(self, symbol):
+        if self.binary:
+            return symbol
+
+        return self.symbol_codes.get(symbol, 0)
+
+    def transition(self, state, code):
+        low = self.row_start[state]
+        high = self.row_start[state + 1]
+        position = bisect_left(self.row_symbols, code, low, high)
+
+        if position < high and self.row_symbols[position] == code:
+            return self.row_targets[position]
+
+        return 0
+
+    def prepare(self, text):
+        if self.ignore_case:
+            return text.lower()
+
+        return text
+
+    def search(self, text):
+        if self.pattern_length == 0:
+            return True
+
+        current_state = 0
+        for symbol in self.prepare(text):
+            current_state = self.transition(current_state, self.code(symbol))
+
+            if current_state == self.pattern_length:
+                return True
+
+        return False
+
+    def find_all(self, text, start_state=0, offset=0):
+        # Позиции начала всех (в том числе перекрывающихся) вхождений.
+        text = self.prepare(text)
+
+        if self.pattern_length == 0:
+            return list(range(offset, offset + len(text) + 1))
+
+        matches = []
+        current_state = start_state
+
+        for position, symbol in enumerate(text):
+            current_state = self.transition(current_state, self.code(symbol))
+
+            if current_state == self.pattern_length:
+                matches.append(offset + position - self.pattern_length + 1)
+
+        return matches
+
+    def table_size(self):
+        return len(self.row_symbols)
+
+
+def unicode_fsm_search(text, pattern, ignore_case=True):
+    return CompressedAutomaton(pattern, ignore_case).search(text)
+
+
+def bytes_fsm_search(data, pattern):
+    return CompressedAutomaton(bytes(pattern)).search(data)
+
+
+def parse_class_pattern(pattern):
+    # Шаблон — последовательность позиций: обычный символ, '.' (любой символ),
+    # класс [abc], диапазон [a-z] или отрицание [^...]; '\\' экранирует.
+    # Каждая позиция — пара (negated, chars).
+    positions = []
+    index = 0
+
+    while index < len(pattern):
+        char = pattern[index]
+
+        if char == '\\':
+            if index + 1 == len(pattern):
+                raise ValueError("Pattern ends with an escape")
+            positions.append((False, frozenset(pattern[index + 1])))
+            index += 2
+        elif char == '.':
+            positions.append((True, frozenset()))
+            index += 1
+        elif char == '[':
+            index += 1
+            negated = index < len(pattern) and pattern[index] == '^'
+            if negated:
+                index += 1
+
+            chars = set()
+            first = True
+            while index < len(pattern) and (pattern[index] != ']' or first):
+                first = False
+                current = pattern[index]
+                if current == '\\' and index + 1 < len(pattern):
+                    index += 1
+                    current = pattern[index]
+
+                if index + 2 < len(pattern) and pattern[index + 1] == '-' and pattern[index + 2] != ']':
+                    last = pattern[index + 2]
+                    if ord(last) < ord(current):
+                        raise ValueError(f"Bad range {current}-{last}")
+                    chars.update(chr(code) for code in range(ord(current), ord(last) + 1))
+                    index += 3
+                else:
+                    chars.add(current)
+                    index += 1
+
+            if index == len(pattern):
+                raise ValueError("Unterminated character class")
+
+            positions.append((negated, frozenset(chars)))
+            index += 1
+        else:
+            positions.append((False, frozenset(char)))
+            index += 1
+
+    return positions
+
+
+class CharacterClassDFA:
+    # Шаблон с классами и '.' компилируется в минимальный ДКА для Σ*·шаблон.
+    # Символы с одинаковой принадлежностью всем позициям склеиваются в один
+    # класс, поэтому таблица имеет размер (состояния × классы), а поиск —
+    # тот же табличный цикл, что и в search_pattern: O(n) без откатов.
+    def __init__(self, pattern, ignore_case=True, max_states=10000):
+        self.ignore_case = ignore_case
+        if ignore_case:
+            pattern = pattern.lower()
+
+        positions = parse_class_pattern(pattern)
+        self.pattern_length = len(positions)
+
+        mentioned = sorted(set().union(*(chars for _, chars in positions)))
+        signatures = {}
+        self.char_class = {}
+        for char in mentioned:
+            signature = tuple((char in chars) != negated for negated, chars in positions)
+            self.char_class[char] = signatures.setdefault(signature, len(signatures))
+
+        other_signature = tuple(negated for negated, _ in positions)
+        self.other_class = signatures.setdefault(other_signature, len(signatures))
+        class_signatures = sorted(signatures, key=signatures.get)
+        self.class_count = len(class_signatures)
+
+        # Состояние НКА i — «совпали первые i позиций»; состояние ДКА — маска.
+        final_bit = 1 << self.pattern_length
+        masks = [1]
+        numbers = {1: 0}
+        transitions = []
+
+        state = 0
+        while state < len(masks):
+            mask = masks[state]
+            row = []
+
+            for signature in class_signatures:
+                next_mask = 1
+                for position, matches in enumerate(signature):
+                    if matches and mask >> position & 1:
+                        next_mask |= 1 << (position + 1)
+
+                if next_mask not in numbers:
+                    if len(masks) >= max_states:
+                        raise ValueError(f"DFA exceeds {max_states} states")
+                    numbers[next_mask] = len(masks)
+                    masks.append(next_mask)
+
+                row.append(numbers[next_mask])
+
+            transitions.append(row)
+            state += 1
+
+        accepting = [bool(mask & final_bit) for mask in masks]
+        self.minimize(transitions, accepting)
+
+    def minimize(self, transitions, accepting):
+        # Алгоритм Мура: дробим разбиение, пока оно меняется.
+        blocks = [int(is_accepting) for is_accepting in accepting]
+        blocks_count = len(set(blocks))
+
+        while True:
+            signatures = {}
+            new_blocks = []
+            for state, row in enumerate(transitions):
+                signature = (blocks[state], tuple(blocks[target] for target in row))
+                new_blocks.append(signatures.setdefault(signature, len(signatures)))
+
+            if len(signatures) == blocks_count:
+                break
+            blocks, blocks_count = new_blocks, len(signatures)
+
+        # Переименовываем так, чтобы начальное состояние было 0.
+        renumber = {}
+        for state in range(len(transitions)):
+            renumber.setdefault(blocks[state], len(renumber))
+
+        self.state_count = len(renumber)
+        self.transition_table = array('I', [0]) * (self.state_count * self.class_count)
+        self.accepting = array('b', [0]) * self.state_count
+
+        for state, row in enumerate(transitions):
+            new_state = renumber[blocks[state]]
+            self.accepting[new_state] = accepting[state]
+            for char_class, target in enumerate(row):
+                self.transition_table[new_state * self.class_count + char_class] = renumber[blocks[target]]
+
+    def table_size(self):
+        return len(self.transition_table) * self.transition_table.itemsize
+
+    def search(self, text):
+        if self.pattern_length == 0:
+            return True
+
+        if self.ignore_case:
+            text = text.lower()
+
+        current_state = 0
+        for character in text:
+            char_index = self.char_class.get(character, self.other_class)
+            current_state = self.transition_table[current_state * self.class_count + char_index]
+
+            if self.accepting[current_state]:
+                return True
+
+        return False
+
+    def find_all(self, text):
+        # Позиции начала всех вхождений (длина совпадения всегда m).
+        if self.ignore_case:
+            text = text.lower()
+
+        matches = []
+        current_state = 0
+        for position, character in enumerate(text):
+            char_index = self.char_class.get(character, self.other_class)
+            current_state = self.transition_table[current_state * self.class_count + char_index]
+
+            if self.accepting[current_state]:
+                matches.append(position - self.pattern_length + 1)
+
+        return matches
+
+
+def class_pattern_search(text, pattern):
+    return CharacterClassDFA(pattern).search(text)
+
+
 def main():
     test_cases = [
         ("abcd", "abcd", True),
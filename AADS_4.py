@@ -1,10 +1,25 @@
+from pattern_cache import PATTERN_CACHE
+
+
 def knuth_morris_pratt_search(text, pattern):
     if not pattern:
         return True
     
-    prefix_function = build_prefix_function(pattern)
+    compiled = PATTERN_CACHE.get("kmp", pattern, None, CompiledKMPPattern)
     
-    return search_with_prefix_function(text, pattern, prefix_function)
+    return compiled.search(text)
+
+
+class CompiledKMPPattern:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.prefix_function = build_prefix_function(pattern)
+
+    def search(self, text):
+        return search_with_prefix_function(text, self.pattern, self.prefix_function)
+
+    def find_all(self, text):
+        return find_all_with_prefix_function(text, self.pattern, self.prefix_function)
 
 
 def build_prefix_function(pattern):
@@ -41,6 +56,119 @@ def search_with_prefix_function(text, pattern, prefix_function):
     return False
 
 
+def as_sequence(data):
+    # str и list индексируются как есть; всё, что поддерживает buffer
+    # protocol (bytes, array, одномерные массивы NumPy), оборачивается в
+    # memoryview — элементы читаются прямо из буфера, без копии.
+    if isinstance(data, (str, list, tuple)):
+        return data
+
+    view = memoryview(data)
+    if view.ndim != 1:
+        raise ValueError("Only one-dimensional buffers are supported")
+
+    # memoryview читает только нативные форматы; массивы с другим порядком
+    # байт (например, dtype '>i4') индексируются напрямую.
+    try:
+        view[:1].tolist()
+    except NotImplementedError:
+        view.release()
+        if not hasattr(data, "__getitem__"):
+            raise ValueError(f"Unsupported buffer format: {data!r}")
+        return data
+
+    return view
+
+
+def knuth_morris_pratt_find_all(text, pattern):
+    text = as_sequence(text)
+    pattern = as_sequence(pattern)
+
+    if len(pattern) == 0:
+        return list(range(len(text) + 1))
+
+    return find_all_with_prefix_function(text, pattern, build_prefix_function(pattern))
+
+
+def find_all_with_prefix_function(text, pattern, prefix_function, offset=0):
+    # Все (в том числе перекрывающиеся) вхождения; text может быть str,
+    # bytes или memoryview — сравниваются элементы, без декодирования.
+    pattern_length = len(pattern)
+    matched_chars_count = 0
+    matches = []
+
+    for position, current_char in enumerate(text):
+        while matched_chars_count > 0 and pattern[matched_chars_count] != current_char:
+            matched_chars_count = prefix_function[matched_chars_count - 1]
+        
+        if pattern[matched_chars_count] == current_char:
+            matched_chars_count += 1
+        
+        if matched_chars_count == pattern_length:
+            matches.append(offset + position - pattern_length + 1)
+            matched_chars_count = prefix_function[matched_chars_count - 1]
+
+    return matches
+
+
+class StreamingKMPMatcher:
+    # Та же логика, что в search_with_prefix_function, но matched_chars_count
+    # переживает вызовы feed(), поэтому поток можно подавать кусками.
+    # Хранятся только шаблон и префикс-функция — O(m) памяти.
+    def __init__(self, pattern):
+        if not pattern:
+            raise ValueError("Pattern must be non-empty")
+
+        self.pattern = pattern
+        self.prefix_function = build_prefix_function(pattern)
+        self.matched_chars_count = 0
+        self.position = 0
+
+    def feed(self, chunk):
+        pattern = self.pattern
+        prefix_function = self.prefix_function
+        pattern_length = len(pattern)
+        matched_chars_count = self.matched_chars_count
+        matches = []
+
+        for current_char in chunk:
+            while matched_chars_count > 0 and pattern[matched_chars_count] != current_char:
+                matched_chars_count = prefix_function[matched_chars_count - 1]
+
+            if pattern[matched_chars_count] == current_char:
+                matched_chars_count += 1
+
+            self.position += 1
+
+            if matched_chars_count == pattern_length:
+                matches.append(self.position - pattern_length)
+                matched_chars_count = prefix_function[matched_chars_count - 1]
+
+        self.matched_chars_count = matched_chars_count
+
+        return matches
+
+    def reset(self):
+        self.matched_chars_count = 0
+        self.position = 0
+
+
+async def stream_search(reader, pattern, chunk_size=64 * 1024):
+    # Асинхронный генератор абсолютных позиций совпадений в asyncio.StreamReader.
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+
+    matcher = StreamingKMPMatcher(pattern)
+
+    while True:
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            break
+
+        for offset in matcher.feed(chunk):
+            yield offset
+
+
 def run_tests():
     test_cases = [
         ("abcd", "abcd", True, "Полное совпадение"),
@@ -1,11 +1,25 @@
+from AADS_4 import as_sequence
+from pattern_cache import PATTERN_CACHE
+
+
 def boyer_moore_search(text, pattern):
     if not pattern or not text:
         return pattern in text
     
-    bad_char_table = build_bad_character_table(pattern)
-    good_suffix_shift, prefix_suffix_match = build_good_suffix_tables(pattern)
+    compiled = PATTERN_CACHE.get("boyer_moore", pattern, "a-z", CompiledBoyerMoorePattern)
     
-    return perform_search(text, pattern, bad_char_table, good_suffix_shift, prefix_suffix_match)
+    return compiled.search(text)
+
+
+class CompiledBoyerMoorePattern:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.bad_char_table = build_bad_character_table(pattern)
+        self.good_suffix_shift, self.prefix_suffix_match = build_good_suffix_tables(pattern)
+
+    def search(self, text):
+        return perform_search(text, self.pattern, self.bad_char_table,
+                              self.good_suffix_shift, self.prefix_suffix_match)
 
 
 def build_bad_character_table(pattern):
@@ -75,6 +89,86 @@ def perform_search(text, pattern, bad_char_table, good_suffix_shift, prefix_suff
     return pattern_found
 
 
+def build_last_occurrence_table(pattern):
+    # Правило плохого символа для любого алфавита: словарь вместо 26 ячеек.
+    last_occurrence = {}
+    for position in range(len(pattern)):
+        last_occurrence[pattern[position]] = position
+
+    return last_occurrence
+
+
+def build_strong_good_suffix_table(pattern):
+    # Сдвиги по правилу хорошего суффикса через массив границ, за O(m).
+    pattern_length = len(pattern)
+    shift = [0] * (pattern_length + 1)
+    border = [0] * (pattern_length + 1)
+
+    position = pattern_length
+    border_position = pattern_length + 1
+    border[position] = border_position
+
+    while position > 0:
+        while border_position <= pattern_length and pattern[position - 1] != pattern[border_position - 1]:
+            if shift[border_position] == 0:
+                shift[border_position] = border_position - position
+            border_position = border[border_position]
+
+        position -= 1
+        border_position -= 1
+        border[position] = border_position
+
+    border_position = border[0]
+    for position in range(pattern_length + 1):
+        if shift[position] == 0:
+            shift[position] = border_position
+        if position == border_position:
+            border_position = border[border_position]
+
+    return shift
+
+
+def boyer_moore_find_all(text, pattern):
+    # Все позиции вхождений в str, bytes, array или одномерном массиве NumPy.
+    text = as_sequence(text)
+    pattern = as_sequence(pattern)
+    text_length = len(text)
+    pattern_length = len(pattern)
+
+    if pattern_length == 0:
+        return list(range(text_length + 1))
+
+    last_occurrence = build_last_occurrence_table(pattern)
+    good_suffix_shift = build_strong_good_suffix_table(pattern)
+
+    return scan_with_strong_tables(text, pattern, last_occurrence, good_suffix_shift)
+
+
+def scan_with_strong_tables(text, pattern, last_occurrence, good_suffix_shift, first_only=False):
+    # Проход Бойера–Мура по готовым таблицам; first_only — остановиться
+    # на первом вхождении.
+    text_length = len(text)
+    pattern_length = len(pattern)
+    matches = []
+    current_position = 0
+
+    while current_position <= text_length - pattern_length:
+        pattern_index = pattern_length - 1
+        while pattern_index >= 0 and pattern[pattern_index] == text[current_position + pattern_index]:
+            pattern_index -= 1
+
+        if pattern_index < 0:
+            matches.append(current_position)
+            if first_only:
+                break
+            current_position += good_suffix_shift[0]
+        else:
+            bad_char_shift = pattern_index - last_occurrence.get(text[current_position + pattern_index], -1)
+            current_position += max(good_suffix_shift[pattern_index + 1], bad_char_shift)
+
+    return matches
+
+
 def main():
     test_cases = [
         ("abcd", "abcd", True),
@@ -0,0 +1,190 @@
+import json
+import sys
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+MAGIC = b"AHOCORASICK1\n"
+
+ARRAY_NAMES = ("edge_start", "edge_chars", "edge_targets", "fail", "output_link",
+               "output_start", "output_ids", "pattern_lengths")
+
+
+def aho_corasick_search(text, patterns):
+    return AhoCorasickAutomaton(patterns).find_all(text)
+
+
+class AhoCorasickAutomaton:
+    # Бор по шаблонам + ссылки неудач, как в автомате из AADS_3, но сразу для
+    # всех шаблонов. Переходы бора хранятся в CSR-виде (edge_start задаёт
+    # диапазон рёбер состояния, рёбра отсортированы по символу), выходы —
+    # тоже в CSR, а output_link ведёт к ближайшему по ссылкам неудач
+    # состоянию, в котором заканчивается какой-нибудь шаблон.
+    def __init__(self, patterns=None):
+        if patterns is None:
+            return
+
+        patterns = [pattern.lower() for pattern in patterns]
+        if any(not pattern for pattern in patterns):
+            raise ValueError("Patterns must be non-empty")
+
+        self.alphabet = "".join(sorted(set("".join(patterns))))
+        self.char_index = {char: index + 1 for index, char in enumerate(self.alphabet)}
+
+        children = [{}]
+        outputs = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                code = self.char_index[char]
+                if code not in children[state]:
+                    children[state][code] = len(children)
+                    children.append({})
+                    outputs.append([])
+                state = children[state][code]
+            outputs[state].append(pattern_id)
+
+        states_count = len(children)
+        fail = array('I', [0]) * states_count
+        output_link = array('I', [0]) * states_count
+
+        queue = deque(children[0].values())
+        while queue:
+            state = queue.popleft()
+
+            for code, child in children[state].items():
+                fallback = fail[state]
+                while fallback and code not in children[fallback]:
+                    fallback = fail[fallback]
+
+                target = children[fallback].get(code, 0)
+                fail[child] = target if target != child else 0
+                output_link[child] = fail[child] if outputs[fail[child]] else output_link[fail[child]]
+
+                queue.append(child)
+
+        self.edge_start = array('I', [0])
+        self.edge_chars = array('I')
+        self.edge_targets = array('I')
+        self.output_start = array('I', [0])
+        self.output_ids = array('I')
+
+        for state in range(states_count):
+            for code in sorted(children[state]):
+                self.edge_chars.append(code)
+                self.edge_targets.append(children[state][code])
+            self.edge_start.append(len(self.edge_chars))
+
+            self.output_ids.extend(outputs[state])
+            self.output_start.append(len(self.output_ids))
+
+        self.fail = fail
+        self.output_link = output_link
+        self.pattern_lengths = array('I', map(len, patterns))
+
+    def __len__(self):
+        return len(self.fail)
+
+    def next_state(self, state, code):
+        while True:
+            low = self.edge_start[state]
+            high = self.edge_start[state + 1]
+            position = bisect_left(self.edge_chars, code, low, high)
+
+            if position < high and self.edge_chars[position] == code:
+                return self.edge_targets[position]
+
+            if state == 0:
+                return 0
+
+            state = self.fail[state]
+
+    def find_all(self, text):
+        # Возвращает (pattern_id, end_offset), где end_offset — позиция сразу
+        # после совпадения: text[end_offset - len(pattern):end_offset].
+        matches = []
+        char_index = self.char_index
+        output_start = self.output_start
+        output_ids = self.output_ids
+        output_link = self.output_link
+        state = 0
+
+        for position, char in enumerate(text.lower()):
+            code = char_index.get(char, 0)
+
+            if code == 0:
+                state = 0
+                continue
+
+            state = self.next_state(state, code)
+
+            reported = state if output_start[state] != output_start[state + 1] else output_link[state]
+            while reported:
+                for pattern_id in output_ids[output_start[reported]:output_start[reported + 1]]:
+                    matches.append((pattern_id, position + 1))
+                reported = output_link[reported]
+
+        return matches
+
+    def contains_any(self, text):
+        return bool(self.find_all(text))
+
+    def to_bytes(self):
+        header = {
+            "alphabet": self.alphabet,
+            "byteorder": sys.byteorder,
+            "lengths": [len(getattr(self, name)) for name in ARRAY_NAMES],
+        }
+
+        parts = [MAGIC, json.dumps(header, ensure_ascii=False).encode("utf-8"), b"\n"]
+        parts.extend(getattr(self, name).tobytes() for name in ARRAY_NAMES)
+
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if not data.startswith(MAGIC):
+            raise ValueError("Not a compiled Aho-Corasick automaton")
+
+        header_end = data.index(b"\n", len(MAGIC))
+        header = json.loads(data[len(MAGIC):header_end].decode("utf-8"))
+
+        automaton = cls()
+        automaton.alphabet = header["alphabet"]
+        automaton.char_index = {char: index + 1 for index, char in enumerate(automaton.alphabet)}
+
+        offset = header_end + 1
+        for name, length in zip(ARRAY_NAMES, header["lengths"]):
+            values = array('I')
+            size = length * values.itemsize
+            values.frombytes(data[offset:offset + size])
+            offset += size
+
+            if header["byteorder"] != sys.byteorder:
+                values.byteswap()
+
+            setattr(automaton, name, values)
+
+        return automaton
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+def main():
+    patterns = ["he", "she", "his", "hers"]
+    text = "ushers"
+
+    print(f"Шаблоны: {patterns}, текст: '{text}'")
+    for pattern_id, end_offset in aho_corasick_search(text, patterns):
+        print(f"  '{patterns[pattern_id]}' заканчивается на позиции {end_offset}")
+
+
+if __name__ == "__main__":
+    main()
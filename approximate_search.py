@@ -0,0 +1,135 @@
+def build_character_masks(pattern):
+    # Маска символа: бит i установлен, если pattern[i] == символ.
+    masks = {}
+    for position, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << position)
+
+    return masks
+
+
+def hamming_find_all(text, pattern, k):
+    # Shift-Or с k несовпадениями (Ву–Манбер): в state[j] нулевой бит i
+    # означает, что pattern[:i + 1] совпадает с концом прочитанного текста
+    # не более чем с j заменами. Возвращает (end_offset, distance), где
+    # end_offset — позиция сразу после совпадения.
+    pattern_length = len(pattern)
+    if pattern_length == 0:
+        return []
+
+    full_mask = (1 << pattern_length) - 1
+    high_bit = 1 << (pattern_length - 1)
+    not_masks = {char: full_mask & ~mask for char, mask in build_character_masks(pattern).items()}
+
+    states = [full_mask] * (k + 1)
+    matches = []
+
+    for position, char in enumerate(text):
+        char_mask = not_masks.get(char, full_mask)
+
+        previous = states[0]
+        states[0] = ((previous << 1) | char_mask) & full_mask
+
+        for errors in range(1, k + 1):
+            current = states[errors]
+            states[errors] = ((current << 1) | char_mask) & (previous << 1) & full_mask
+            previous = current
+
+        for errors in range(k + 1):
+            if not states[errors] & high_bit:
+                matches.append((position + 1, errors))
+                break
+
+    return matches
+
+
+def hamming_search(text, pattern, k):
+    if not pattern:
+        return True
+
+    return bool(hamming_find_all(text, pattern, k))
+
+
+def edit_distance_find_all(text, pattern, k):
+    # Алгоритм Майерса: столбец матрицы редакционного расстояния хранится
+    # как две битовые маски положительных/отрицательных разностей, score —
+    # расстояние от всего шаблона до лучшей подстроки, кончающейся здесь.
+    pattern_length = len(pattern)
+    if pattern_length == 0:
+        return []
+
+    full_mask = (1 << pattern_length) - 1
+    high_bit = 1 << (pattern_length - 1)
+    masks = build_character_masks(pattern)
+
+    positive_vertical = full_mask
+    negative_vertical = 0
+    score = pattern_length
+    matches = []
+
+    for position, char in enumerate(text):
+        equal = masks.get(char, 0)
+
+        vertical = equal | negative_vertical
+        horizontal = (((equal & positive_vertical) + positive_vertical) ^ positive_vertical) | equal
+
+        positive_horizontal = negative_vertical | (full_mask & ~(horizontal | positive_vertical))
+        negative_horizontal = positive_vertical & horizontal
+
+        if positive_horizontal & high_bit:
+            score += 1
+        elif negative_horizontal & high_bit:
+            score -= 1
+
+        positive_horizontal = (positive_horizontal << 1) & full_mask
+        negative_horizontal = (negative_horizontal << 1) & full_mask
+
+        positive_vertical = negative_horizontal | (full_mask & ~(vertical | positive_horizontal))
+        negative_vertical = positive_horizontal & vertical
+
+        if score <= k:
+            matches.append((position + 1, score))
+
+    return matches
+
+
+def edit_distance_search(text, pattern, k):
+    if not pattern:
+        return True
+
+    return bool(edit_distance_find_all(text, pattern, k))
+
+
+def approximate_search(text, pattern, k, mode="edit"):
+    if mode == "edit":
+        return edit_distance_search(text, pattern, k)
+
+    if mode == "hamming":
+        return hamming_search(text, pattern, k)
+
+    raise ValueError(f"Unknown mode: {mode}")
+
+
+def approximate_find_all(text, pattern, k, mode="edit"):
+    if mode == "edit":
+        return edit_distance_find_all(text, pattern, k)
+
+    if mode == "hamming":
+        return hamming_find_all(text, pattern, k)
+
+    raise ValueError(f"Unknown mode: {mode}")
+
+
+def main():
+    examples = [
+        ("the quick brown fox", "quikc", 2),
+        ("patternmatching", "matchimg", 1),
+        ("abcdefg", "xyz", 1),
+    ]
+
+    for text, pattern, k in examples:
+        print(f"edit('{text}', '{pattern}', k={k}) = {edit_distance_find_all(text, pattern, k)}")
+        print(f"hamming('{text}', '{pattern}', k={k}) = {hamming_find_all(text, pattern, k)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import ast
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+
+from AADS_3 import build_flat_transition_table, search_pattern_flat
+from AADS_4 import build_prefix_function, search_with_prefix_function
+from AADS_5 import (build_bad_character_table, build_good_suffix_tables, build_last_occurrence_table,
+                    build_strong_good_suffix_table, perform_search, scan_with_strong_tables)
+
+SEED = 2024
+TEXT_LENGTH = 200_000
+PATTERN_LENGTHS = [4, 16, 64, 256]
+REPEATS = 3
+
+
+def build_fsm(pattern):
+    return build_flat_transition_table(pattern)
+
+
+def scan_fsm(text, pattern, table):
+    return search_pattern_flat(text, pattern, table)
+
+
+def build_kmp(pattern):
+    return build_prefix_function(pattern)
+
+
+def scan_kmp(text, pattern, prefix_function):
+    return search_with_prefix_function(text, pattern, prefix_function)
+
+
+def build_boyer_moore(pattern):
+    return (build_bad_character_table(pattern), *build_good_suffix_tables(pattern))
+
+
+def scan_boyer_moore(text, pattern, tables):
+    return perform_search(text, pattern, *tables)
+
+
+def build_boyer_moore_strong(pattern):
+    return build_last_occurrence_table(pattern), build_strong_good_suffix_table(pattern)
+
+
+def scan_boyer_moore_strong(text, pattern, tables):
+    return bool(scan_with_strong_tables(text, pattern, *tables, first_only=True))
+
+
+def build_str_find(pattern):
+    return None
+
+
+def scan_str_find(text, pattern, _):
+    return text.find(pattern) != -1
+
+
+ENGINES = {
+    "fsm": (build_fsm, scan_fsm),
+    "kmp": (build_kmp, scan_kmp),
+    "boyer_moore": (build_boyer_moore, scan_boyer_moore),
+    "boyer_moore_strong": (build_boyer_moore_strong, scan_boyer_moore_strong),
+    "str.find": (build_str_find, scan_str_find),
+}
+
+
+def english_prose():
+    # raw_text берётся из LAB4.py через ast: сам скрипт при импорте печатает статистику.
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "LAB4.py"), encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(target, "id", None) == "raw_text" for target in node.targets):
+            return re.sub(r"[^a-z]+", "", node.value.value.lower())
+
+    raise ValueError("raw_text not found in LAB4.py")
+
+
+def make_corpora(rng, length):
+    prose = english_prose()
+
+    return {
+        "random_latin": "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(length)),
+        "dna": "".join(rng.choice("acgt") for _ in range(length)),
+        "english": (prose * (length // len(prose) + 1))[:length],
+        "periodic": "a" * length,
+    }
+
+
+def make_pattern(rng, corpus_name, text, pattern_length):
+    # Для периодического текста — худший случай a…ab (полный проход без
+    # совпадения); для остальных — кусок из последних 10% текста, чтобы
+    # поиск до первого вхождения прошёл почти весь текст.
+    if corpus_name == "periodic":
+        return "a" * (pattern_length - 1) + "b"
+
+    start = rng.randrange(len(text) * 9 // 10, len(text) - pattern_length)
+    return text[start:start + pattern_length]
+
+
+def best_time(function, *args):
+    best = None
+    result = None
+
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, result
+
+
+def run_benchmarks(text_length=TEXT_LENGTH, pattern_lengths=PATTERN_LENGTHS, seed=SEED):
+    rng = random.Random(seed)
+    corpora = make_corpora(rng, text_length)
+    results = []
+
+    for corpus_name, text in corpora.items():
+        for pattern_length in pattern_lengths:
+            pattern = make_pattern(rng, corpus_name, text, pattern_length)
+            expected = pattern in text
+
+            for engine_name, (build, scan) in ENGINES.items():
+                build_seconds, tables = best_time(build, pattern)
+                scan_seconds, found = best_time(scan, text, pattern, tables)
+
+                results.append({
+                    "corpus": corpus_name,
+                    "engine": engine_name,
+                    "pattern_length": pattern_length,
+                    "build_seconds": build_seconds,
+                    "scan_seconds": scan_seconds,
+                    "found": found,
+                    "expected": expected,
+                    # Время неверного ответа нельзя сравнивать с остальными.
+                    "valid": found == expected,
+                })
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "seed": seed,
+            "text_length": text_length,
+            "repeats": REPEATS,
+        },
+        "results": results,
+    }
+
+
+def main():
+    arguments = sys.argv[1:]
+    quick = "--quick" in arguments
+    paths = [argument for argument in arguments if argument != "--quick"]
+
+    report = run_benchmarks(text_length=20_000 if quick else TEXT_LENGTH,
+                            pattern_lengths=[4, 16] if quick else PATTERN_LENGTHS)
+    output = json.dumps(report, indent=2, sort_keys=True)
+
+    if paths:
+        with open(paths[0], "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    invalid = [row for row in report["results"] if not row["valid"]]
+    if invalid:
+        # Сводка уходит в stderr, чтобы JSON в stdout оставался разбираемым.
+        print(f"{len(invalid)} of {len(report['results'])} rows gave a wrong answer "
+              f"and are marked \"valid\": false:", file=sys.stderr)
+        for row in invalid:
+            print(f"  {row['engine']:20} {row['corpus']:14} m={row['pattern_length']:<4} "
+                  f"found={row['found']} expected={row['expected']}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
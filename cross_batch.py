@@ -0,0 +1,210 @@
+import numpy as np
+
+from predicates import ORIENTATION_ERROR_BOUND, cross_sign, line_intersection, orientation_sign
+
+NO_CROSS = 0
+ONE_POINT = 1
+TWO_POINTS = 2
+COLINEAR = 3
+
+CONDITION_BOUND = 2.0 ** -20
+
+
+def as_points(points):
+    return np.asarray(points, dtype=np.float64).reshape(-1, 2)
+
+
+def line_coefficients(first, second):
+    # k и b как в AADS_2.Line; для вертикальных прямых значения
+    # не используются и закрываются масками.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = (first[:, 1] - second[:, 1]) / (first[:, 0] - second[:, 0])
+        b = first[:, 1] - k * first[:, 0]
+
+    return k, b
+
+
+def as_raw_points(points):
+    return np.asarray(points).reshape(-1, 2)
+
+
+def certified_sign(left, right, exact_rows, left_zero, right_zero):
+    # Знак left - right по строкам и маска строк, где он гарантированно верен:
+    # оценка ошибки Шевчука, точные строки (целые координаты малого модуля)
+    # или оба произведения заведомо нулевые (нулевой сомножитель).
+    determinant = left - right
+    certain = (np.abs(determinant) > ORIENTATION_ERROR_BOUND * (np.abs(left) + np.abs(right))) | \
+              exact_rows | (left_zero & right_zero)
+
+    return np.sign(determinant), certain
+
+
+def lines_cross_batch(a, b, c, d):
+    raw = [as_raw_points(a), as_raw_points(b), as_raw_points(c), as_raw_points(d)]
+    a, b, c, d = (points.astype(np.float64) for points in raw)
+
+    integer = all(points.dtype.kind in "iub" for points in raw)
+
+    first_vertical = raw[0][:, 0] == raw[1][:, 0]
+    second_vertical = raw[2][:, 0] == raw[3][:, 0]
+
+    x = np.full(len(a), np.nan)
+    y = np.full(len(a), np.nan)
+    kind = np.full(len(a), ONE_POINT, dtype=np.int8)
+
+    # Как в lines_cross: две вертикальные (или вырожденные) прямые — "Colinear",
+    # одна вертикальная задаёт x, а y берётся на другой прямой.
+    both_vertical = first_vertical & second_vertical
+    kind[both_vertical] = COLINEAR
+
+    first_dx, first_dy = b[:, 0] - a[:, 0], b[:, 1] - a[:, 1]
+    second_dx, second_dy = d[:, 0] - c[:, 0], d[:, 1] - c[:, 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        only_first = first_vertical & ~second_vertical
+        x[only_first] = a[only_first, 0]
+        y[only_first] = c[only_first, 1] + (x[only_first] - c[only_first, 0]) * \
+            second_dy[only_first] / second_dx[only_first]
+
+        only_second = second_vertical & ~first_vertical
+        x[only_second] = c[only_second, 0]
+        y[only_second] = a[only_second, 1] + (x[only_second] - a[only_second, 0]) * \
+            first_dy[only_second] / first_dx[only_second]
+
+    # Строки, где векторные произведения в float64 точные: целые координаты
+    # по модулю меньше 2**25 (разности < 2**26, произведения < 2**52).
+    coordinates = np.hstack((a, b, c, d))
+    with np.errstate(invalid="ignore"):
+        exact_rows = np.all((coordinates == np.floor(coordinates)) & (np.abs(coordinates) < 2 ** 25), axis=1)
+
+    left, right = first_dx * second_dy, first_dy * second_dx
+    direction_sign, direction_certain = certified_sign(
+        left, right, exact_rows,
+        (first_dx == 0) | (second_dy == 0), (first_dy == 0) | (second_dx == 0))
+
+    offset_dx, offset_dy = c[:, 0] - a[:, 0], c[:, 1] - a[:, 1]
+    left, right = first_dx * offset_dy, first_dy * offset_dx
+    same_line_sign, same_line_certain = certified_sign(
+        left, right, exact_rows,
+        (first_dx == 0) | (offset_dy == 0), (first_dy == 0) | (offset_dx == 0))
+
+    if integer:
+        ia, ib, ic, id_ = (points.astype(np.int64) for points in raw)
+        magnitude = np.max(np.abs(np.hstack((ia, ib, ic, id_))), axis=1)
+
+        # Целые больше 2**53 не переводятся во float64 без потерь, и оценки
+        # для float к таким строкам неприменимы.
+        lossless = magnitude <= 2 ** 53
+        direction_certain &= lossless
+        same_line_certain &= lossless
+
+    # Точку по правилу Крамера можно считать в float64, только если знаменатель
+    # надёжно ненулевой и не слишком мал: у почти параллельных прямых
+    # относительная ошибка точки растёт как (|l| + |r|) / |det|.
+    left, right = first_dx * second_dy, first_dy * second_dx
+    well_conditioned = np.abs(left - right) > CONDITION_BOUND * (np.abs(left) + np.abs(right))
+    crossing = ~first_vertical & ~second_vertical & direction_certain & well_conditioned
+
+    # Целочисленный ввод до 2**30 по модулю решается точно в int64.
+    if integer:
+        small = magnitude < 2 ** 30
+
+        integer_direction = (ib[:, 0] - ia[:, 0]) * (id_[:, 1] - ic[:, 1]) - \
+                            (ib[:, 1] - ia[:, 1]) * (id_[:, 0] - ic[:, 0])
+        integer_same_line = (ib[:, 0] - ia[:, 0]) * (ic[:, 1] - ia[:, 1]) - \
+                            (ib[:, 1] - ia[:, 1]) * (ic[:, 0] - ia[:, 0])
+
+        direction_sign = np.where(small, np.sign(integer_direction), direction_sign)
+        same_line_sign = np.where(small, np.sign(integer_same_line), same_line_sign)
+        direction_certain |= small
+        same_line_certain |= small
+
+    general = ~first_vertical & ~second_vertical
+    parallel = general & direction_certain & (direction_sign == 0)
+    kind[parallel & same_line_certain & (same_line_sign == 0)] = COLINEAR
+    kind[parallel & same_line_certain & (same_line_sign != 0)] = NO_CROSS
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (offset_dx * second_dy - offset_dy * second_dx) / (first_dx * second_dy - first_dy * second_dx)
+    x[crossing] = a[crossing, 0] + t[crossing] * first_dx[crossing]
+    y[crossing] = a[crossing, 1] + t[crossing] * first_dy[crossing]
+
+    # Остаются только строки с действительно неопределённым знаком:
+    # они пересчитываются точными предикатами по исходным координатам.
+    uncertain = general & ~crossing & ~(parallel & same_line_certain)
+
+    for row in np.flatnonzero(uncertain):
+        first, second, third, fourth = (points[row].tolist() for points in raw)
+
+        if cross_sign(first, second, third, fourth) != 0:
+            x[row], y[row] = line_intersection(first, second, third, fourth)
+        elif orientation_sign(first, second, third) == 0:
+            kind[row] = COLINEAR
+        else:
+            kind[row] = NO_CROSS
+
+    return np.column_stack((x, y)), kind
+
+
+def segment_and_line_cross_batch(a, b, c, d):
+    c, d = as_points(c), as_points(d)
+    points, kind = lines_cross_batch(a, b, c, d)
+
+    x, y = points[:, 0], points[:, 1]
+    with np.errstate(invalid="ignore"):
+        inside = (np.minimum(c[:, 0], d[:, 0]) <= x) & (x <= np.maximum(c[:, 0], d[:, 0])) & \
+                 (np.minimum(c[:, 1], d[:, 1]) <= y) & (y <= np.maximum(c[:, 1], d[:, 1]))
+
+    missed = (kind == ONE_POINT) & ~inside
+    kind[missed] = NO_CROSS
+    points[missed] = np.nan
+
+    return points, kind
+
+
+def line_and_circle_cross_batch(a, b, o, r):
+    a, b, o = as_points(a), as_points(b), as_points(o)
+    r = np.broadcast_to(np.asarray(r, dtype=np.float64), (len(a),))
+
+    vertical = a[:, 0] - b[:, 0] == 0
+    k, line_b = line_coefficients(a, b)
+
+    # Для вертикальной прямой решаем квадратное уравнение по y, иначе по x.
+    with np.errstate(invalid="ignore"):
+        quadratic_a = np.where(vertical, 1.0, 1 + k ** 2)
+        quadratic_b = np.where(vertical, -2 * o[:, 1],
+                               -2 * o[:, 0] - 2 * o[:, 1] * k + 2 * k * line_b)
+        quadratic_c = np.where(vertical, o[:, 1] ** 2 - r ** 2 + (a[:, 0] - o[:, 0]) ** 2,
+                               o[:, 0] ** 2 + line_b ** 2 + o[:, 1] ** 2 - 2 * line_b * o[:, 1] - r ** 2)
+
+        discriminant = quadratic_b ** 2 - 4 * quadratic_a * quadratic_c
+
+    kind = np.full(len(a), TWO_POINTS, dtype=np.int8)
+    kind[discriminant < 0] = NO_CROSS
+    kind[discriminant == 0] = ONE_POINT
+
+    with np.errstate(invalid="ignore"):
+        root = np.sqrt(discriminant)
+        first_root = (-quadratic_b + root) / (2 * quadratic_a)
+        second_root = (-quadratic_b - root) / (2 * quadratic_a)
+
+    touching = kind == ONE_POINT
+    first_root[touching] = -quadratic_b[touching] / (2 * quadratic_a[touching])
+
+    points = np.full((len(a), 2, 2), np.nan)
+
+    first_x = np.where(vertical, a[:, 0], first_root)
+    second_x = np.where(vertical, a[:, 0], second_root)
+    with np.errstate(invalid="ignore"):
+        first_y = np.where(vertical, first_root, k * first_root + line_b)
+        second_y = np.where(vertical, second_root, k * second_root + line_b)
+
+    has_first = kind != NO_CROSS
+    has_second = kind == TWO_POINTS
+
+    points[has_first, 0, 0] = first_x[has_first]
+    points[has_first, 0, 1] = first_y[has_first]
+    points[has_second, 1, 0] = second_x[has_second]
+    points[has_second, 1, 1] = second_y[has_second]
+
+    return points, kind
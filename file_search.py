@@ -0,0 +1,54 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from AADS_3 import CompressedAutomaton
+from AADS_4 import build_prefix_function, find_all_with_prefix_function
+
+CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def search_chunk(path, pattern, algorithm, start, end, owned_end):
+    # Кусок [start, end) включает m - 1 байт перекрытия; свои совпадения —
+    # только те, что начинаются до owned_end, остальные найдёт следующий кусок.
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped)[start:end] as chunk:
+            if algorithm == "fsm":
+                matches = CompressedAutomaton(pattern).find_all(chunk, offset=start)
+            else:
+                matches = find_all_with_prefix_function(chunk, pattern, build_prefix_function(pattern), start)
+
+    return [match for match in matches if match < owned_end]
+
+
+def find_all_in_file(path, pattern, algorithm="fsm", chunk_size=CHUNK_SIZE, workers=None):
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+
+    if not pattern:
+        raise ValueError("Pattern must be non-empty")
+
+    if algorithm not in ("fsm", "kmp"):
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    file_size = os.path.getsize(path)
+    if file_size < len(pattern):
+        return []
+
+    overlap = len(pattern) - 1
+    chunk_size = max(chunk_size, 1)
+    starts = range(0, file_size, chunk_size)
+
+    tasks = [(path, pattern, algorithm, start,
+              min(start + chunk_size + overlap, file_size), min(start + chunk_size, file_size))
+             for start in starts]
+
+    if len(tasks) == 1 or workers == 1:
+        results = [search_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(search_chunk, *zip(*tasks)))
+
+    # Куски идут по порядку и не пересекаются по «своим» позициям,
+    # поэтому склейка сразу даёт упорядоченный список без повторов.
+    return [match for matches in results for match in matches]
@@ -0,0 +1,139 @@
+from AADS_1 import calculate_distance_squared, convex_hull
+from predicates import orientation_sign
+
+OUTSIDE = -1
+BOUNDARY = 0
+INSIDE = 1
+
+LOCATION_NAMES = {OUTSIDE: "Outside", BOUNDARY: "Boundary", INSIDE: "Inside"}
+
+
+def on_segment(a, b, point):
+    # Точка уже коллинеарна отрезку ab: остаётся проверить, что она между концами.
+    return calculate_distance_squared(a, point) <= calculate_distance_squared(a, b) and \
+           calculate_distance_squared(b, point) <= calculate_distance_squared(a, b)
+
+
+class ConvexPolygonIndex:
+    # Веер треугольников из hull[0]: бинарный поиск по углу находит нужный
+    # треугольник за O(log h), затем одна проверка ориентации по ребру оболочки.
+    def __init__(self, hull):
+        self.hull = [(point[0], point[1]) for point in hull]
+
+    @classmethod
+    def from_points(cls, dots, mode="auto"):
+        hull = convex_hull(dots, mode)
+        if hull is None:
+            raise ValueError("Convex hull is degenerate")
+
+        return cls(hull)
+
+    def locate_code(self, point):
+        hull = self.hull
+        h = len(hull)
+
+        if h < 3:
+            if orientation_sign(hull[0], hull[-1], point) == 0 and on_segment(hull[0], hull[-1], point):
+                return BOUNDARY
+            return OUTSIDE
+
+        origin = hull[0]
+        first_orientation = orientation_sign(origin, hull[1], point)
+        last_orientation = orientation_sign(origin, hull[-1], point)
+
+        if first_orientation < 0 or last_orientation > 0:
+            return OUTSIDE
+
+        if first_orientation == 0:
+            return BOUNDARY if on_segment(origin, hull[1], point) else OUTSIDE
+
+        if last_orientation == 0:
+            return BOUNDARY if on_segment(origin, hull[-1], point) else OUTSIDE
+
+        low = 1
+        high = h - 1
+        while high - low > 1:
+            middle = (low + high) // 2
+            if orientation_sign(origin, hull[middle], point) >= 0:
+                low = middle
+            else:
+                high = middle
+
+        edge_orientation = orientation_sign(hull[low], hull[high], point)
+
+        if edge_orientation > 0:
+            return INSIDE
+        if edge_orientation == 0:
+            return BOUNDARY
+
+        return OUTSIDE
+
+    def locate(self, point):
+        return LOCATION_NAMES[self.locate_code(point)]
+
+    def __contains__(self, point):
+        return self.locate_code(point) != OUTSIDE
+
+    def locate_many(self, points):
+        import numpy as np
+
+        points = np.asarray(points)
+        hull = np.asarray(self.hull)
+
+        if points.dtype.kind in "iub" and hull.dtype.kind in "iub":
+            # В int64 векторные произведения точны, пока |координаты| < 2**30;
+            # при больших значениях numpy молча переполняется, поэтому считаем
+            # в Python int (dtype=object) — так же точно, как locate_code.
+            magnitude = max(abs(int(hull.min())), abs(int(hull.max())))
+            if len(points):
+                magnitude = max(magnitude, abs(int(points.min())), abs(int(points.max())))
+            dtype = np.int64 if magnitude < 2 ** 30 else object
+        else:
+            dtype = np.result_type(points.dtype, hull.dtype, np.int64)
+
+        hull = hull.astype(dtype)
+        query_x = points[:, 0].astype(hull.dtype)
+        query_y = points[:, 1].astype(hull.dtype)
+
+        def orientation(a_x, a_y, b_x, b_y):
+            return (b_x - a_x) * (query_y - a_y) - (b_y - a_y) * (query_x - a_x)
+
+        def between(a_x, a_y, b_x, b_y):
+            length = (a_x - b_x) ** 2 + (a_y - b_y) ** 2
+            return ((query_x - a_x) ** 2 + (query_y - a_y) ** 2 <= length) & \
+                   ((query_x - b_x) ** 2 + (query_y - b_y) ** 2 <= length)
+
+        h = len(hull)
+        codes = np.full(len(points), OUTSIDE, dtype=np.int8)
+
+        if h < 3:
+            a_x, a_y = hull[0]
+            b_x, b_y = hull[-1]
+            boundary = (orientation(a_x, a_y, b_x, b_y) == 0) & between(a_x, a_y, b_x, b_y)
+            codes[boundary] = BOUNDARY
+            return codes
+
+        origin_x, origin_y = hull[0]
+        first_orientation = orientation(origin_x, origin_y, hull[1, 0], hull[1, 1])
+        last_orientation = orientation(origin_x, origin_y, hull[-1, 0], hull[-1, 1])
+
+        on_first_edge = (first_orientation == 0) & (last_orientation <= 0) & \
+            between(origin_x, origin_y, hull[1, 0], hull[1, 1])
+        on_last_edge = (last_orientation == 0) & (first_orientation >= 0) & \
+            between(origin_x, origin_y, hull[-1, 0], hull[-1, 1])
+        in_fan = (first_orientation > 0) & (last_orientation < 0)
+
+        low = np.ones(len(points), dtype=np.intp)
+        high = np.full(len(points), h - 1, dtype=np.intp)
+        for _ in range((h - 1).bit_length()):
+            middle = (low + high) // 2
+            right_of_middle = orientation(origin_x, origin_y, hull[middle, 0], hull[middle, 1]) >= 0
+            low = np.where(right_of_middle, middle, low)
+            high = np.where(right_of_middle, high, middle)
+
+        edge_orientation = orientation(hull[low, 0], hull[low, 1], hull[high, 0], hull[high, 1])
+
+        codes[in_fan & (edge_orientation > 0)] = INSIDE
+        codes[(in_fan & (edge_orientation == 0)) | on_first_edge | on_last_edge] = BOUNDARY
+
+        return codes
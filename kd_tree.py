@@ -0,0 +1,200 @@
+import heapq
+import math
+
+from point_loader import split_coordinates
+
+LEAF_SIZE = 8
+
+
+class KDTree:
+    # Неявное k-d дерево: узел — это отрезок order[low:high], разделяющая
+    # точка стоит в середине, ось чередуется по глубине (x, y, x, ...).
+    def __init__(self, dots):
+        self.xs, self.ys = split_coordinates(dots)
+        self.xs, self.ys = list(self.xs), list(self.ys)
+        self.order = list(range(len(self.xs)))
+        self.build()
+
+    @classmethod
+    def from_array(cls, points):
+        import numpy as np
+
+        points = np.asarray(points)
+        tree = cls.__new__(cls)
+        tree.xs = points[:, 0].tolist()
+        tree.ys = points[:, 1].tolist()
+
+        # Медианы ищутся argpartition, поэтому построение идёт в numpy.
+        order = np.arange(len(points))
+        stack = [(0, len(points), 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if high - low <= LEAF_SIZE:
+                continue
+
+            middle = (low + high) // 2
+            segment = order[low:high]
+            keys = points[segment, depth % 2]
+            order[low:high] = segment[np.argpartition(keys, middle - low)]
+
+            stack.append((low, middle, depth + 1))
+            stack.append((middle + 1, high, depth + 1))
+
+        tree.order = order.tolist()
+        return tree
+
+    def build(self):
+        columns = (self.xs, self.ys)
+        stack = [(0, len(self.order), 0)]
+
+        while stack:
+            low, high, depth = stack.pop()
+            if high - low <= LEAF_SIZE:
+                continue
+
+            self.order[low:high] = sorted(self.order[low:high], key=columns[depth % 2].__getitem__)
+
+            middle = (low + high) // 2
+            stack.append((low, middle, depth + 1))
+            stack.append((middle + 1, high, depth + 1))
+
+    def __len__(self):
+        return len(self.order)
+
+    def distance_squared(self, index, x, y):
+        return (self.xs[index] - x) ** 2 + (self.ys[index] - y) ** 2
+
+    def knn(self, point, k=1):
+        x, y = point[0], point[1]
+        best = []
+
+        def visit(low, high, depth):
+            if high - low <= LEAF_SIZE:
+                for index in self.order[low:high]:
+                    offer(index)
+                return
+
+            middle = (low + high) // 2
+            index = self.order[middle]
+            offer(index)
+
+            delta = (x - self.xs[index]) if depth % 2 == 0 else (y - self.ys[index])
+            near, far = ((low, middle), (middle + 1, high)) if delta < 0 else ((middle + 1, high), (low, middle))
+
+            visit(near[0], near[1], depth + 1)
+            if len(best) < k or delta ** 2 <= -best[0][0]:
+                visit(far[0], far[1], depth + 1)
+
+        def offer(index):
+            distance = self.distance_squared(index, x, y)
+            if len(best) < k:
+                heapq.heappush(best, (-distance, -index))
+            elif distance < -best[0][0]:
+                heapq.heapreplace(best, (-distance, -index))
+
+        if k > 0:
+            visit(0, len(self.order), 0)
+
+        return [(math.sqrt(-distance), -index) for distance, index in sorted(best, reverse=True)]
+
+    def radius_search(self, point, radius):
+        x, y = point[0], point[1]
+        radius_squared = radius ** 2
+        found = []
+        stack = [(0, len(self.order), 0)]
+
+        while stack:
+            low, high, depth = stack.pop()
+
+            if high - low <= LEAF_SIZE:
+                found.extend(index for index in self.order[low:high]
+                             if self.distance_squared(index, x, y) <= radius_squared)
+                continue
+
+            middle = (low + high) // 2
+            index = self.order[middle]
+            if self.distance_squared(index, x, y) <= radius_squared:
+                found.append(index)
+
+            delta = (x - self.xs[index]) if depth % 2 == 0 else (y - self.ys[index])
+            if delta <= radius:
+                stack.append((low, middle, depth + 1))
+            if delta >= -radius:
+                stack.append((middle + 1, high, depth + 1))
+
+        return sorted(found)
+
+    def knn_many(self, points, k=1):
+        results = [self.knn(point, k) for point in iterate_points(points)]
+
+        if hasattr(points, "ndim"):
+            import numpy as np
+
+            distances = np.full((len(results), k), np.inf)
+            indices = np.full((len(results), k), -1, dtype=np.int64)
+            for row, result in enumerate(results):
+                for column, (distance, index) in enumerate(result):
+                    distances[row, column] = distance
+                    indices[row, column] = index
+
+            return distances, indices
+
+        return results
+
+    def radius_search_many(self, points, radius):
+        return [self.radius_search(point, radius) for point in iterate_points(points)]
+
+
+def iterate_points(points):
+    if hasattr(points, "ndim"):
+        return points.tolist()
+
+    xs, ys = split_coordinates(points)
+    return zip(xs, ys)
+
+
+def closest_pair(dots):
+    # Классический «разделяй и властвуй» с полосой: O(n log n).
+    # Возвращает (расстояние, i, j) или None, если точек меньше двух.
+    xs, ys = split_coordinates(dots)
+    n = len(xs)
+
+    if n < 2:
+        return None
+
+    by_x = sorted(range(n), key=ys.__getitem__)
+    by_x.sort(key=xs.__getitem__)
+
+    def distance_squared(i, j):
+        return (xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2
+
+    def solve(indices):
+        # Возвращает лучшую пару и те же индексы, отсортированные по y.
+        if len(indices) <= 3:
+            best = (math.inf, -1, -1)
+            for position, i in enumerate(indices):
+                for j in indices[position + 1:]:
+                    best = min(best, (distance_squared(i, j), min(i, j), max(i, j)))
+            return best, sorted(indices, key=ys.__getitem__)
+
+        middle = len(indices) // 2
+        middle_x = xs[indices[middle]]
+
+        left_best, left_by_y = solve(indices[:middle])
+        right_best, right_by_y = solve(indices[middle:])
+        best = min(left_best, right_best)
+
+        merged = list(heapq.merge(left_by_y, right_by_y, key=ys.__getitem__))
+
+        strip = [i for i in merged if (xs[i] - middle_x) ** 2 < best[0]]
+        for position, i in enumerate(strip):
+            for j in strip[position + 1:]:
+                if (ys[j] - ys[i]) ** 2 >= best[0]:
+                    break
+                best = min(best, (distance_squared(i, j), min(i, j), max(i, j)))
+
+        return best, merged
+
+    (distance, first, second), _ = solve(by_x)
+
+    return (math.sqrt(distance), first, second)
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+
+
+class PatternCache:
+    # LRU-кэш скомпилированных шаблонов по ключу (алгоритм, шаблон, алфавит).
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, algorithm, pattern, alphabet, compile_pattern):
+        key = (algorithm, pattern, alphabet)
+
+        # Изменяемые шаблоны (list, bytearray) не хэшируются и в кэш не
+        # попадают: их содержимое может поменяться после компиляции.
+        try:
+            hash(key)
+        except TypeError:
+            self.misses += 1
+            return compile_pattern(pattern)
+
+        compiled = self.entries.get(key)
+        if compiled is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return compiled
+
+        self.misses += 1
+        compiled = compile_pattern(pattern)
+
+        if self.maxsize > 0:
+            self.entries[key] = compiled
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+        return compiled
+
+    def resize(self, maxsize):
+        self.maxsize = maxsize
+        while len(self.entries) > max(maxsize, 0):
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self.entries), "maxsize": self.maxsize}
+
+    def __len__(self):
+        return len(self.entries)
+
+
+PATTERN_CACHE = PatternCache()
+
+
+def set_pattern_cache_size(maxsize):
+    PATTERN_CACHE.resize(maxsize)
@@ -0,0 +1,93 @@
+import sys
+from array import array
+
+
+def read_buffer(source=None):
+    if source is None:
+        return sys.stdin.buffer.read()
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            return file.read()
+
+    data = source.read()
+    if isinstance(data, str):
+        data = data.encode()
+
+    return data
+
+
+def parse_text_points(data):
+    # Формат как в main(): сначала n, затем n пар "x y".
+    tokens = data.split()
+    if not tokens:
+        return array('q')
+
+    n = int(tokens[0])
+    coordinates = array('q', map(int, tokens[1:1 + 2 * n]))
+
+    if len(coordinates) != 2 * n:
+        raise ValueError(f"Expected {n} points, got {len(coordinates) // 2}")
+
+    return coordinates
+
+
+def parse_binary_points(data):
+    # Сырые пары (x, y) как little-endian int64 без заголовка.
+    if len(data) % 16 != 0:
+        raise ValueError("Binary point data must be a multiple of 16 bytes")
+
+    coordinates = array('q')
+    coordinates.frombytes(data)
+
+    if sys.byteorder == "big":
+        coordinates.byteswap()
+
+    return coordinates
+
+
+def load_points(source=None, binary=False, as_numpy=False):
+    data = read_buffer(source)
+
+    if as_numpy:
+        import numpy as np
+
+        if binary:
+            if len(data) % 16 != 0:
+                raise ValueError("Binary point data must be a multiple of 16 bytes")
+            return np.frombuffer(data, dtype='<i8').astype(np.int64).reshape(-1, 2)
+
+        return np.array(parse_text_points(data), dtype=np.int64).reshape(-1, 2)
+
+    if binary:
+        return parse_binary_points(data)
+
+    return parse_text_points(data)
+
+
+def count_points(dots):
+    if isinstance(dots, array):
+        return len(dots) // 2
+
+    return len(dots)
+
+
+def split_coordinates(dots):
+    # Возвращает два индексируемых столбца xs и ys, не создавая кортеж на точку.
+    if isinstance(dots, array):
+        return dots[0::2], dots[1::2]
+
+    if hasattr(dots, "ndim"):
+        return dots[:, 0].tolist(), dots[:, 1].tolist()
+
+    return [dot[0] for dot in dots], [dot[1] for dot in dots]
+
+
+def point_at(dots, xs, ys, index):
+    if isinstance(dots, list):
+        return dots[index]
+
+    return (xs[index], ys[index])
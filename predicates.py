@@ -0,0 +1,140 @@
+import sys
+from fractions import Fraction
+
+EPSILON = sys.float_info.epsilon / 2
+
+# Оценки погрешности первого (чисто плавающего) этапа из работы Шевчука
+# "Adaptive Precision Floating-Point Arithmetic and Fast Robust Geometric Predicates".
+ORIENTATION_ERROR_BOUND = (3 + 16 * EPSILON) * EPSILON
+INCIRCLE_ERROR_BOUND = (10 + 96 * EPSILON) * EPSILON
+
+
+def sign(value):
+    return (value > 0) - (value < 0)
+
+
+def exact(point):
+    return (Fraction(point[0]), Fraction(point[1]))
+
+
+def cross_sign_xy(ax, ay, bx, by, cx, cy, dx, dy):
+    # Знак векторного произведения (b - a) x (d - c). Для целых координат
+    # вычисление сразу точное; для float сначала проверяется оценка ошибки.
+    left = (bx - ax) * (dy - cy)
+    right = (by - ay) * (dx - cx)
+    determinant = left - right
+
+    if type(determinant) is int:
+        return sign(determinant)
+
+    if abs(determinant) > ORIENTATION_ERROR_BOUND * (abs(left) + abs(right)):
+        return sign(determinant)
+
+    ax, ay, bx, by = Fraction(ax), Fraction(ay), Fraction(bx), Fraction(by)
+    cx, cy, dx, dy = Fraction(cx), Fraction(cy), Fraction(dx), Fraction(dy)
+
+    return sign((bx - ax) * (dy - cy) - (by - ay) * (dx - cx))
+
+
+def orientation_sign_xy(ax, ay, bx, by, cx, cy):
+    return cross_sign_xy(ax, ay, bx, by, ax, ay, cx, cy)
+
+
+def cross_sign(a, b, c, d):
+    return cross_sign_xy(a[0], a[1], b[0], b[1], c[0], c[1], d[0], d[1])
+
+
+def orientation_sign(a, b, c):
+    return cross_sign_xy(a[0], a[1], b[0], b[1], a[0], a[1], c[0], c[1])
+
+
+def incircle_sign(a, b, c, d):
+    # > 0, если d внутри окружности через a, b, c (обход против часовой стрелки).
+    adx, ady = a[0] - d[0], a[1] - d[1]
+    bdx, bdy = b[0] - d[0], b[1] - d[1]
+    cdx, cdy = c[0] - d[0], c[1] - d[1]
+
+    bdx_cdy, cdx_bdy = bdx * cdy, cdx * bdy
+    cdx_ady, adx_cdy = cdx * ady, adx * cdy
+    adx_bdy, bdx_ady = adx * bdy, bdx * ady
+
+    a_lift = adx * adx + ady * ady
+    b_lift = bdx * bdx + bdy * bdy
+    c_lift = cdx * cdx + cdy * cdy
+
+    determinant = a_lift * (bdx_cdy - cdx_bdy) + b_lift * (cdx_ady - adx_cdy) + c_lift * (adx_bdy - bdx_ady)
+
+    if type(determinant) is int:
+        return sign(determinant)
+
+    permanent = (abs(bdx_cdy) + abs(cdx_bdy)) * a_lift + \
+                (abs(cdx_ady) + abs(adx_cdy)) * b_lift + \
+                (abs(adx_bdy) + abs(bdx_ady)) * c_lift
+
+    if abs(determinant) > INCIRCLE_ERROR_BOUND * permanent:
+        return sign(determinant)
+
+    a, b, c, d = exact(a), exact(b), exact(c), exact(d)
+    adx, ady = a[0] - d[0], a[1] - d[1]
+    bdx, bdy = b[0] - d[0], b[1] - d[1]
+    cdx, cdy = c[0] - d[0], c[1] - d[1]
+
+    return sign((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy) +
+                (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy) +
+                (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+
+
+def line_intersection_xy(ax, ay, bx, by, cx, cy, dx, dy):
+    # Точка пересечения непараллельных прямых ab и cd по правилу Крамера.
+    # Для целых координат числитель и знаменатель — точные int, и деление
+    # округляется один раз; остальные координаты переводятся в Fraction.
+    if not all(type(value) is int for value in (ax, ay, bx, by, cx, cy, dx, dy)):
+        ax, ay, bx, by = Fraction(ax), Fraction(ay), Fraction(bx), Fraction(by)
+        cx, cy, dx, dy = Fraction(cx), Fraction(cy), Fraction(dx), Fraction(dy)
+
+    denominator = (bx - ax) * (dy - cy) - (by - ay) * (dx - cx)
+    numerator = (cx - ax) * (dy - cy) - (cy - ay) * (dx - cx)
+
+    if denominator < 0:
+        denominator, numerator = -denominator, -numerator
+
+    x = (ax * denominator + numerator * (bx - ax)) / denominator
+    y = (ay * denominator + numerator * (by - ay)) / denominator
+
+    return (float(x), float(y))
+
+
+def line_y_at(a, b, x):
+    # Ордината точки невертикальной прямой ab при данном x, с одним
+    # округлением для целых координат и через Fraction для остальных.
+    if not all(type(value) is int for value in (a[0], a[1], b[0], b[1], x)):
+        a, b, x = exact(a), exact(b), Fraction(x)
+
+    y = (a[1] * (b[0] - a[0]) + (x - a[0]) * (b[1] - a[1])) / (b[0] - a[0])
+
+    return float(y)
+
+
+def line_intersection(a, b, c, d):
+    return line_intersection_xy(a[0], a[1], b[0], b[1], c[0], c[1], d[0], d[1])
+
+
+def between(a, b, point):
+    return min(a[0], b[0]) <= point[0] <= max(a[0], b[0]) and \
+           min(a[1], b[1]) <= point[1] <= max(a[1], b[1])
+
+
+def segments_intersect(a, b, c, d):
+    # Пересекаются ли замкнутые отрезки ab и cd (касание концами считается).
+    first = orientation_sign(c, d, a)
+    second = orientation_sign(c, d, b)
+    third = orientation_sign(a, b, c)
+    fourth = orientation_sign(a, b, d)
+
+    if first * second < 0 and third * fourth < 0:
+        return True
+
+    return (first == 0 and between(c, d, a)) or \
+           (second == 0 and between(c, d, b)) or \
+           (third == 0 and between(a, b, c)) or \
+           (fourth == 0 and between(a, b, d))
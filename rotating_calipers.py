@@ -0,0 +1,109 @@
+import math
+
+from AADS_1 import calculate_distance_squared, calculate_orientation
+
+
+def hull_diameter(hull):
+    return hull_calipers(hull)[0]
+
+
+def hull_minimum_width(hull):
+    return hull_calipers(hull)[1]
+
+
+def hull_minimum_area_rectangle(hull):
+    return hull_calipers(hull)[2]
+
+
+def projection(edge_start, edge_end, point):
+    return (edge_end[0] - edge_start[0]) * (point[0] - edge_start[0]) + \
+           (edge_end[1] - edge_start[1]) * (point[1] - edge_start[1])
+
+
+def rectangle_corners(edge_start, edge_end, min_projection, max_projection, height):
+    edge_x = edge_end[0] - edge_start[0]
+    edge_y = edge_end[1] - edge_start[1]
+    edge_length_squared = edge_x ** 2 + edge_y ** 2
+
+    near = min_projection / edge_length_squared
+    far = max_projection / edge_length_squared
+    up = height / edge_length_squared
+
+    first = (edge_start[0] + edge_x * near, edge_start[1] + edge_y * near)
+    second = (edge_start[0] + edge_x * far, edge_start[1] + edge_y * far)
+    third = (second[0] - edge_y * up, second[1] + edge_x * up)
+    fourth = (first[0] - edge_y * up, first[1] + edge_x * up)
+
+    return [first, second, third, fourth]
+
+
+def hull_calipers(hull):
+    # Оболочка в порядке jarvis_hull: против часовой стрелки, без коллинеарных
+    # точек. Три «суппорта» (дальняя точка, крайняя правая и крайняя левая
+    # проекции) только двигаются вперёд, поэтому весь проход стоит O(h).
+    if not hull:
+        return None
+
+    h = len(hull)
+
+    if h < 3:
+        first, last = hull[0], hull[-1]
+        diameter = (math.sqrt(calculate_distance_squared(first, last)), (first, last))
+        return diameter, (0.0, (first, last), first), (0.0, [first, last, last, first])
+
+    best_diameter_squared = -1
+    diameter_pair = None
+    best_width = math.inf
+    width_support = None
+    best_area = math.inf
+    rectangle = None
+
+    top = 1
+    right = 1
+    left = 0
+
+    for i in range(h):
+        edge_start = hull[i]
+        edge_end = hull[(i + 1) % h]
+
+        while calculate_orientation(edge_start, edge_end, hull[(top + 1) % h]) > \
+                calculate_orientation(edge_start, edge_end, hull[top % h]):
+            top += 1
+
+        for point in (edge_start, edge_end):
+            distance_squared = calculate_distance_squared(point, hull[top % h])
+            if distance_squared > best_diameter_squared:
+                best_diameter_squared = distance_squared
+                diameter_pair = (point, hull[top % h])
+
+        while projection(edge_start, edge_end, hull[(right + 1) % h]) > \
+                projection(edge_start, edge_end, hull[right % h]):
+            right += 1
+
+        if i == 0:
+            left = top
+        while projection(edge_start, edge_end, hull[(left + 1) % h]) < \
+                projection(edge_start, edge_end, hull[left % h]):
+            left += 1
+
+        edge_length = math.sqrt(calculate_distance_squared(edge_start, edge_end))
+        height = calculate_orientation(edge_start, edge_end, hull[top % h])
+
+        width = height / edge_length
+        if width < best_width:
+            best_width = width
+            width_support = ((edge_start, edge_end), hull[top % h])
+
+        min_projection = projection(edge_start, edge_end, hull[left % h])
+        max_projection = projection(edge_start, edge_end, hull[right % h])
+        area = (max_projection - min_projection) * height / edge_length ** 2
+
+        if area < best_area:
+            best_area = area
+            rectangle = rectangle_corners(edge_start, edge_end, min_projection, max_projection, height)
+
+    diameter = (math.sqrt(best_diameter_squared), diameter_pair)
+    minimum_width = (best_width, width_support[0], width_support[1])
+    minimum_rectangle = (best_area, rectangle)
+
+    return diameter, minimum_width, minimum_rectangle
@@ -0,0 +1,293 @@
+import json
+import mmap
+import sys
+from array import array
+
+MAGIC = b"SUFFIXINDEX1\n"
+HEADER_SIZE = 256
+
+
+def build_suffix_array(text):
+    # Удвоение префиксов: на шаге k суффиксы упорядочены по первым 2k
+    # символам. Ключ пары рангов упакован в одно целое, поэтому каждый
+    # шаг — одна сортировка за O(n log n), а всего шагов не больше log n,
+    # итого O(n log² n).
+    n = len(text)
+    if n == 0:
+        return []
+
+    rank = list(text)
+    suffix_array = list(range(n))
+    length = 1
+
+    while True:
+        rank_limit = max(rank) + 2
+        keys = [rank[i] * rank_limit + (rank[i + length] + 1 if i + length < n else 0) for i in range(n)]
+        suffix_array.sort(key=keys.__getitem__)
+
+        new_rank = [0] * n
+        for position in range(1, n):
+            previous, current = suffix_array[position - 1], suffix_array[position]
+            new_rank[current] = new_rank[previous] + (keys[current] != keys[previous])
+        rank = new_rank
+
+        if rank[suffix_array[-1]] == n - 1:
+            return suffix_array
+
+        length *= 2
+
+
+def build_suffix_array_numpy(text):
+    # То же удвоение, но каждый шаг — один np.lexsort по паре рангов.
+    import numpy as np
+
+    n = len(text)
+    if n == 0:
+        return []
+
+    rank = np.frombuffer(bytes(text), dtype=np.uint8).astype(np.int64)
+    length = 1
+
+    while True:
+        second = np.zeros(n, dtype=np.int64)
+        if length < n:
+            second[:n - length] = rank[length:] + 1
+
+        suffix_array = np.lexsort((second, rank))
+        sorted_first = rank[suffix_array]
+        sorted_second = second[suffix_array]
+
+        changed = np.empty(n, dtype=np.int64)
+        changed[0] = 0
+        changed[1:] = (sorted_first[1:] != sorted_first[:-1]) | (sorted_second[1:] != sorted_second[:-1])
+
+        rank = np.empty(n, dtype=np.int64)
+        rank[suffix_array] = np.cumsum(changed)
+
+        if rank[suffix_array[-1]] == n - 1:
+            return suffix_array.tolist()
+
+        length *= 2
+
+
+def build_lcp_array(text, suffix_array):
+    # Алгоритм Касаи: lcp[i] — длина общего префикса suffix_array[i - 1] и suffix_array[i].
+    n = len(text)
+    rank = [0] * n
+    for position, suffix in enumerate(suffix_array):
+        rank[suffix] = position
+
+    lcp = [0] * n
+    common = 0
+    for suffix in range(n):
+        if rank[suffix] == 0:
+            common = 0
+            continue
+
+        previous = suffix_array[rank[suffix] - 1]
+        while suffix + common < n and previous + common < n and text[suffix + common] == text[previous + common]:
+            common += 1
+
+        lcp[rank[suffix]] = common
+        if common:
+            common -= 1
+
+    return lcp
+
+
+class SuffixArrayIndex:
+    # Индекс по байтам текста (str кодируется в UTF-8, позиции — в байтах).
+    def __init__(self, text=None):
+        self.mapped = None
+        self.file = None
+        self.views = []
+        self.text_start = 0
+
+        if text is None:
+            return
+
+        if isinstance(text, str):
+            text = text.encode("utf-8")
+
+        self.text = bytes(text)
+        self.length = len(self.text)
+        typecode = 'i' if len(self.text) < 2 ** 31 else 'q'
+        try:
+            suffix_array = build_suffix_array_numpy(self.text)
+        except ImportError:
+            suffix_array = build_suffix_array(self.text)
+        self.suffix_array = array(typecode, suffix_array)
+        self.lcp = array(typecode, build_lcp_array(self.text, suffix_array))
+
+    def __len__(self):
+        return self.length
+
+    def encode(self, pattern):
+        if isinstance(pattern, str):
+            return pattern.encode("utf-8")
+
+        return bytes(pattern)
+
+    def bound(self, pattern, strict):
+        # Первая позиция, где префикс суффикса >= шаблона (или > при strict).
+        low, high = 0, len(self.suffix_array)
+        pattern_length = len(pattern)
+        # После load() self.text — весь файл, поэтому срез обрезается по
+        # концу текста, иначе он захватит выравнивание и байты массивов.
+        text_end = self.text_start + self.length
+
+        while low < high:
+            middle = (low + high) // 2
+            start = self.text_start + self.suffix_array[middle]
+            prefix = self.text[start:min(start + pattern_length, text_end)]
+
+            if prefix < pattern or (strict and prefix == pattern):
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def range(self, pattern):
+        pattern = self.encode(pattern)
+        if not pattern:
+            return 0, len(self.suffix_array)
+
+        return self.bound(pattern, False), self.bound(pattern, True)
+
+    def contains(self, pattern):
+        first, last = self.range(pattern)
+        return first < last
+
+    def count(self, pattern):
+        first, last = self.range(pattern)
+        return last - first
+
+    def locate(self, pattern):
+        first, last = self.range(pattern)
+        return sorted(self.suffix_array[first:last])
+
+    def longest_repeated_substring(self):
+        if len(self.lcp) < 2:
+            return b""
+
+        position = max(range(len(self.lcp)), key=self.lcp.__getitem__)
+        start = self.text_start + self.suffix_array[position]
+
+        return bytes(self.text[start:start + self.lcp[position]])
+
+    def save(self, path):
+        header = json.dumps({
+            "length": self.length,
+            "typecode": self.suffix_array.typecode,
+            "byteorder": sys.byteorder,
+        }).encode("utf-8")
+
+        if len(MAGIC) + len(header) > HEADER_SIZE:
+            raise ValueError("Header is too long")
+
+        # Массивы выравниваются по 8 байт, чтобы их можно было отобразить
+        # в память через memoryview.cast без копирования.
+        padding = (-self.length) % 8
+
+        with open(path, "wb") as file:
+            file.write((MAGIC + header).ljust(HEADER_SIZE, b" "))
+            file.write(self.text[self.text_start:self.text_start + self.length])
+            file.write(b"\0" * padding)
+            file.write(self.suffix_array.tobytes())
+            file.write(self.lcp.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        index = cls()
+        index.file = open(path, "rb")
+        index.mapped = mmap.mmap(index.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        head = index.mapped[:HEADER_SIZE]
+        if not head.startswith(MAGIC):
+            index.close()
+            raise ValueError("Not a suffix array index")
+
+        header = json.loads(head[len(MAGIC):].decode("utf-8"))
+        length = header["length"]
+        typecode = header["typecode"]
+        itemsize = array(typecode).itemsize
+
+        text_start = HEADER_SIZE
+        suffix_start = text_start + length + (-length) % 8
+        lcp_start = suffix_start + length * itemsize
+
+        # Текст читается срезами mmap прямо из файла.
+        index.text = index.mapped
+        index.text_start = text_start
+        index.length = length
+
+        if header["byteorder"] == sys.byteorder:
+            view = memoryview(index.mapped)
+            suffix_view = view[suffix_start:lcp_start]
+            lcp_view = view[lcp_start:lcp_start + length * itemsize]
+            index.suffix_array = suffix_view.cast(typecode)
+            index.lcp = lcp_view.cast(typecode)
+            index.views = [index.suffix_array, index.lcp, suffix_view, lcp_view, view]
+        else:
+            index.suffix_array = array(typecode, index.mapped[suffix_start:lcp_start])
+            index.lcp = array(typecode, index.mapped[lcp_start:lcp_start + length * itemsize])
+            index.suffix_array.byteswap()
+            index.lcp.byteswap()
+
+        return index
+
+    def close(self):
+        if self.mapped is None:
+            return
+
+        for view in self.views:
+            view.release()
+        self.views = []
+
+        self.text = self.suffix_array = self.lcp = None
+        self.mapped.close()
+        self.file.close()
+        self.mapped = self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    import os
+    import tempfile
+
+    test_cases = [
+        ("banana", "ana", 2),
+        ("banana", "nab", 0),
+        ("abracadabra", "abra", 2),
+        ("c" * 97 + "a" + "c" * 5 + "b", "ba", 0),
+        ("xyzb", "b\0", 0),
+        ("mississippi", "ssi", 2),
+    ]
+
+    print("Суффиксный массив: построение, сохранение и загрузка:")
+    print("-" * 50)
+
+    for text, pattern, expected in test_cases:
+        index = SuffixArrayIndex(text)
+        path = os.path.join(tempfile.mkdtemp(), "index.sa")
+        index.save(path)
+
+        with SuffixArrayIndex.load(path) as loaded:
+            result = (index.count(pattern), loaded.count(pattern))
+            same_positions = index.locate(pattern) == loaded.locate(pattern)
+
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+        status = "✓" if result == (expected, expected) and same_positions else "✗"
+        print(f"{status} count({text!r}, {pattern!r}) = {result[0]}, после load = {result[1]}")
+
+
+if __name__ == "__main__":
+    main()